@@ -12,7 +12,9 @@ LOG_MODULE = 'CameraTools'
 from .utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
-from .event_handlers import PaletteIncomingEventHandler
+from .utilities import event_hub, prefs_utils
+from . import event_handlers
+from .event_handlers import PaletteIncomingEventHandler, _initialize_controllers_for_palette
 
 app = adsk.core.Application.get()
 ui = app.userInterface if app else None
@@ -82,15 +84,12 @@ class ShowPaletteCommandExecuteHandler(adsk.core.CommandEventHandler):
                 event_handlers_list.append(palette_incoming_handler)
 
                 # Set global reference for event handlers
-                from . import event_handlers
                 event_handlers.active_palette_instance = active_palette_instance
 
             # Show palette and send preferences
             if active_palette_instance:
                 active_palette_instance.isVisible = True
-                from .utilities import prefs_utils
                 prefs_utils.send_prefs(active_palette_instance)
-                from .event_handlers import _initialize_controllers_for_palette
                 _initialize_controllers_for_palette(active_palette_instance)
         except Exception as e:
             if ui:
@@ -140,7 +139,6 @@ class PaletteCloseEventHandler(adsk.core.UserInterfaceGeneralEventHandler):
             if active_palette_instance:
                 active_palette_instance.isVisible = False
             active_palette_instance = None
-            from . import event_handlers
             event_handlers.active_palette_instance = None
         except Exception as e:
             if ui:
@@ -150,16 +148,9 @@ def cleanup_palette_resources():
     """Clean up palette resources by delegating to all controllers."""
     global active_palette_instance
     try:
-        from .controllers.ui_controller import get_ui_controller
-        get_ui_controller().cleanup_for_palette_close()
-        from .controllers.overlay_controller import get_overlay_controller
-        get_overlay_controller().cleanup_for_palette_close()
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().cleanup_for_palette_close()
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().cleanup_for_palette_close()
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().cleanup_for_palette_close()
+        for get_controller in event_handlers.CONTROLLER_GETTERS:
+            get_controller().cleanup_for_palette_close()
+        event_hub.clear()
     except Exception:
         active_palette_instance = None
 
@@ -192,6 +183,7 @@ def run(context):
     try:
         ui = app.userInterface
         cleanup_application()
+        event_handlers_list.clear()  # Drop handlers left over from a previous session
         show_palette_command_definition = ui.commandDefinitions.itemById(button_properties['id'])
         if not show_palette_command_definition:
             show_palette_command_definition = ui.commandDefinitions.addButtonDefinition(
@@ -215,10 +207,21 @@ def run(context):
         if ui:
             ui.messageBox(f'❌ Failed to start CameraTools:\n{traceback.format_exc()}')
 
+def _assert_no_leaked_handlers():
+    """Log and release any event handlers still referenced after cleanup."""
+    if event_handlers_list:
+        log_utils.log(app, f'Releasing {len(event_handlers_list)} event handlers on stop', level='WARNING', module=LOG_MODULE)
+        event_handlers_list.clear()
+    if event_handlers.event_handlers_list:
+        log_utils.log(app, f'Releasing {len(event_handlers.event_handlers_list)} palette event handlers on stop', level='WARNING', module=LOG_MODULE)
+        event_handlers.event_handlers_list.clear()
+
 def stop(context):
     """Stop the add-in and clean up resources."""
     try:
         cleanup_application()
+        prefs_utils.flush_prefs()
+        _assert_no_leaked_handlers()
     except Exception as e:
         if ui:
             ui.messageBox(f'❌ Failed to stop CameraTools:\n{traceback.format_exc()}')
\ No newline at end of file
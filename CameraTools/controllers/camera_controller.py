@@ -5,7 +5,9 @@ No direct math or API calls except for orchestration.
 """
 
 import adsk
+import functools
 import threading
+import time
 import traceback
 
 LOG_MODULE = 'camera_controller'
@@ -13,35 +15,65 @@ LOG_MODULE = 'camera_controller'
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
-from ..utilities import camera_telemetry, camera_commands, camera_calculations, camera_transforms, view_utils
+from ..utilities import camera_telemetry, camera_commands, camera_calculations, camera_transforms, event_hub, view_utils
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
+# Custom event ID for flushing coalesced slider updates on the main thread
+CT_CAMERA_FLUSH_EVENT_ID = 'CameraTools_CameraFlushEvent'
+CAMERA_UPDATE_DEBOUNCE = 0.016  # ~60Hz trailing-edge window
+IDLE_TICK_THRESHOLD = 30  # Unchanged 30Hz ticks (~1s) before dropping to 15Hz
+PROPERTY_EPSILON = 1e-6  # UI values closer than this to the last one are duplicates
+
+class PendingCameraFlushHandler(adsk.core.CustomEventHandler):
+    """Applies coalesced camera updates (main thread safe)."""
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = controller
+
+    def notify(self, eventArgs):
+        try:
+            self.controller._flush_pending()
+        except Exception:
+            pass  # Suppress errors for deferred camera flush
+
+def _capture_camera(camera):
+    """
+    Capture camera state with one asArray() call per vector instead of .x/.y/.z reads.
+    """
+    return {
+        'eye': camera.eye.asArray(),
+        'target': camera.target.asArray(),
+        'upVector': camera.upVector.asArray(),
+        'perspectiveAngle': camera.perspectiveAngle,
+        'cameraType': camera.cameraType
+    }
+
 class CameraController:
     """
     Singleton controller for camera state and UI communication.
     """
-    _instance = None
-    _lock = threading.RLock()
-
-    def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
 
     def __init__(self):
-        if self._initialized:
-            return
         self.initial_camera_state = None
         self.active_palette = None
         self.distance_bounds = None
         self._pending_camera_update = {}
         self._pending_update_timer = None
-        self._pending_update_lock = threading.RLock()
-        self._initialized = True
+        self._applying = False  # Re-entry guard; Fusion events all run on the UI thread
+        self._eye_lock_active = False  # Mirrored from EyeLevelController
+        self._flush_event = None
+        self._flush_event_handler = None
+        self._deferred_telemetry_deadline = None
+        self._last_sent_hash = None
+        self._last_camera_signature = None
+        self._idle_ticks = 0
+        self._telemetry_tick = 0
+        self.telemetry_paused = False
+        self._frame_subscription = None
+        self._document_close_subscription = None
+        self._last_values = {}  # Property -> value last sent by the UI; cleared when the camera moves otherwise
 
     # ========== Palette Lifecycle ==========
 
@@ -51,6 +83,17 @@ class CameraController:
         """
         try:
             self.active_palette = palette
+            self._last_sent_hash = None
+            self._last_camera_signature = None
+            self._last_values = {}
+            self._idle_ticks = 0
+            if self._frame_subscription is None:
+                # Commands (e.g. redefining the front view) may change the document up; re-derive afterwards
+                self._frame_subscription = event_hub.subscribe(event_hub.COMMAND_TERMINATED, camera_transforms.clear_canonical_cache)
+            if self._document_close_subscription is None:
+                # Drop the closed design's cached up vector and frame
+                self._document_close_subscription = event_hub.subscribe(event_hub.DOCUMENT_CLOSED, camera_transforms.clear_canonical_cache)
+            self._register_flush_event()
             self.record_initial_camera_state()
             self.update_distance_bounds()
             self.send_camera_state_to_ui()
@@ -62,15 +105,51 @@ class CameraController:
         Cleanup controller state when palette closes.
         """
         try:
-            self.active_palette = None
             self.initial_camera_state = None
             self.distance_bounds = None
+            self._deferred_telemetry_deadline = None
+            self._last_sent_hash = None
+            self._last_values = {}
             self._pending_camera_update = {}
             if self._pending_update_timer:
                 self._pending_update_timer.cancel()
                 self._pending_update_timer = None
+            self._unregister_flush_event()
+            if self._frame_subscription is not None:
+                event_hub.unsubscribe(self._frame_subscription)
+                self._frame_subscription = None
+            if self._document_close_subscription is not None:
+                event_hub.unsubscribe(self._document_close_subscription)
+                self._document_close_subscription = None
+            camera_transforms.clear_canonical_cache()
         except Exception:
             pass
+        finally:
+            self.active_palette = None
+
+    def _register_flush_event(self):
+        """
+        Register the custom event used to apply debounced updates on the main thread.
+        """
+        if self._flush_event_handler is not None:
+            return
+        handler = PendingCameraFlushHandler(self)
+        self._flush_event = app.registerCustomEvent(CT_CAMERA_FLUSH_EVENT_ID)
+        self._flush_event.add(handler)
+        self._flush_event_handler = handler  # Keep a reference!
+
+    def _unregister_flush_event(self):
+        """
+        Remove the debounce custom event and its handler.
+        """
+        if self._flush_event is not None and self._flush_event_handler is not None:
+            try:
+                self._flush_event.remove(self._flush_event_handler)
+                app.unregisterCustomEvent(CT_CAMERA_FLUSH_EVENT_ID)
+            except Exception:
+                pass
+        self._flush_event = None
+        self._flush_event_handler = None
 
     def cleanup(self):
         """
@@ -83,45 +162,86 @@ class CameraController:
     def handle_camera_property_change(self, property_name, value, palette, force=False):
         """
         Handle camera property changes from UI.
+        Non-forced changes are coalesced and applied once per debounce window;
+        forced changes (e.g. camera type) are applied immediately.
         """
         if not palette:
             return
+        # Slider edges and echoed state resend the value just applied; skip the camera math for those
+        last = self._last_values.get(property_name)
+        if not force and last is not None and abs(last - value) < PROPERTY_EPSILON:
+            return
+        self._last_values[property_name] = value
         self.active_palette = palette
-        with self._pending_update_lock:
-            self._pending_camera_update[property_name] = value
+        self._pending_camera_update[property_name] = value
+        # Queued drag samples only touch the pending dict; the camera is read when it is actually needed
+        viewport = camera = None
+
+        # --- Eye lock logic: capture eye/target/upVector if FOV/FL is being changed ---
+        fov_or_fl_changing = property_name in ('fov', 'focalLength')
+        if self._eye_lock_active and fov_or_fl_changing:
+            viewport = app.activeViewport
+            camera = viewport.camera
+            captured = _capture_camera(camera)
+            self._pending_camera_update['eye'] = captured['eye']
+            self._pending_camera_update['target'] = captured['target']
+            self._pending_camera_update['upVector'] = captured['upVector']
+
+        if force or self._flush_event_handler is None:
+            if self._pending_update_timer:
+                self._pending_update_timer.cancel()
+                self._pending_update_timer = None
+            self._apply_pending_camera_update(force=force, viewport=viewport, camera=camera)
+        elif self._pending_update_timer is None:
+            self._pending_update_timer = threading.Timer(CAMERA_UPDATE_DEBOUNCE, self._request_flush)
+            self._pending_update_timer.daemon = True
+            self._pending_update_timer.start()
 
-            # --- Eye lock logic: capture eye/target/upVector if FOV/FL is being changed ---
-            from ..utilities import eye_level_utils
-            eye_lock_active = eye_level_utils.is_eye_level_lock_active()
-            fov_or_fl_changing = property_name in ('fov', 'focalLength')
-            if eye_lock_active and fov_or_fl_changing:
-                camera = app.activeViewport.camera
-                self._pending_camera_update['eye'] = {'x': camera.eye.x, 'y': camera.eye.y, 'z': camera.eye.z}
-                self._pending_camera_update['target'] = {'x': camera.target.x, 'y': camera.target.y, 'z': camera.target.z}
-                self._pending_camera_update['upVector'] = {'x': camera.upVector.x, 'y': camera.upVector.y, 'z': camera.upVector.z}
+    def _request_flush(self):
+        """
+        Timer callback: hand the flush back to Fusion's main thread.
+        """
+        app.fireCustomEvent(CT_CAMERA_FLUSH_EVENT_ID, '')
 
-            self._apply_pending_camera_update(force=force)
+    def _flush_pending(self):
+        """
+        Apply all property changes accumulated during the debounce window.
+        """
+        self._pending_update_timer = None
+        if self._pending_camera_update:
+            self._apply_pending_camera_update(force=True)
 
-    def _apply_pending_camera_update(self, force=False):
+    def _apply_pending_camera_update(self, force=False, viewport=None, camera=None):
         """
         Apply pending camera property changes.
         """
-        with self._pending_update_lock:
-            try:
-                pending_type = self._pending_camera_update.get('cameraType')
-                current_type = app.activeViewport.camera.cameraType
-                if pending_type is not None and pending_type != current_type:
-                    from ..utilities.camera_commands import sanitize_camera_for_type_change
-                    sanitize_camera_for_type_change(
-                        app.activeViewport.camera, app.activeViewport, app, adsk,
-                        target_camera_type=pending_type
-                    )
-                payload = camera_commands.build_camera_payload(self._pending_camera_update, app)
-                camera_commands.apply_camera_state(payload, app, apply_mode="ui")
-                self.send_camera_state_to_ui(force=force)
-                self._pending_camera_update.clear()
-            except Exception:
-                pass
+        if self._applying:
+            return  # Skip re-entrant applies triggered from inside an apply
+        self._applying = True
+        pending = self._pending_camera_update
+        self._pending_camera_update = {}
+        try:
+            if viewport is None:
+                viewport = app.activeViewport
+            if camera is None:
+                camera = viewport.camera
+            pending_type = pending.get('cameraType')
+            if pending_type is not None and pending_type != camera.cameraType:
+                camera_commands.sanitize_camera_for_type_change(
+                    camera, viewport, app, adsk,
+                    target_camera_type=pending_type
+                )
+            payload = camera_commands.build_camera_payload(pending, app)
+            camera_commands.apply_camera_state(payload, app, apply_mode="ui")
+            # Our own apply is not an external move, so telemetry must not clear the values just sent;
+            # other properties may have changed as a side effect of this apply, so forget those
+            self._last_camera_signature = self._camera_signature(app.activeViewport.camera)
+            self._last_values = {name: v for name, v in self._last_values.items() if name in pending}
+            self.send_camera_state_to_ui(force=force)
+        except Exception:
+            pass
+        finally:
+            self._applying = False
 
     def apply_camera_data_direct(self, camera_data):
         """
@@ -137,30 +257,35 @@ class CameraController:
 
     # ========== Other Handlers (Non-property) ==========
 
-    def handle_set_eye(self, data, palette=None):
+    def _get_selected_point(self):
         """
-        Set camera eye position from selected construction point.
+        Return the geometry of the selected construction point, or None after prompting the user.
+        Fetches the entity geometry once instead of probing with hasattr first.
         """
         sel = app.userInterface.activeSelections
-        if sel.count == 0 or not hasattr(sel.item(0).entity, 'geometry'):
+        point = getattr(sel.item(0).entity, 'geometry', None) if sel.count > 0 else None
+        if point is None:
             app.userInterface.messageBox("Select a construction point first.")
+        return point
+
+    def handle_set_eye(self, data, palette=None):
+        """
+        Set camera eye position from selected construction point.
+        """
+        point = self._get_selected_point()
+        if point is None:
             return
-        point = sel.item(0).entity.geometry
-        from ..utilities.camera_calculations import set_camera_eye_to_point
-        set_camera_eye_to_point(app, point)
+        camera_calculations.set_camera_eye_to_point(app, point)
         self.send_camera_state_to_ui(force=True)
 
     def handle_set_target(self, data, palette=None):
         """
         Set camera target position from selected construction point.
         """
-        sel = app.userInterface.activeSelections
-        if sel.count == 0 or not hasattr(sel.item(0).entity, 'geometry'):
-            app.userInterface.messageBox("Select a construction point first.")
+        point = self._get_selected_point()
+        if point is None:
             return
-        point = sel.item(0).entity.geometry
-        from ..utilities.camera_calculations import set_camera_target_to_point
-        set_camera_target_to_point(app, point)
+        camera_calculations.set_camera_target_to_point(app, point)
         self.send_camera_state_to_ui(force=True)
 
     def handle_view_fit(self, data, palette):
@@ -201,15 +326,9 @@ class CameraController:
         """
         try:
             camera = app.activeViewport.camera
-            self.initial_camera_state = {
-                'eye': (camera.eye.x, camera.eye.y, camera.eye.z),
-                'target': (camera.target.x, camera.target.y, camera.target.z),
-                'upVector': (camera.upVector.x, camera.upVector.y, camera.upVector.z),
-                'perspectiveAngle': camera.perspectiveAngle,
-                'cameraType': camera.cameraType,
-                'isFitView': getattr(camera, 'isFitView', False),
-                'isSmoothTransition': getattr(camera, 'isSmoothTransition', False)
-            }
+            self.initial_camera_state = _capture_camera(camera)
+            self.initial_camera_state['isFitView'] = getattr(camera, 'isFitView', False)
+            self.initial_camera_state['isSmoothTransition'] = getattr(camera, 'isSmoothTransition', False)
         except Exception:
             pass
 
@@ -241,28 +360,84 @@ class CameraController:
 
     def _delayed_camera_state_to_ui(self, delay=0.15):
         """
-        Send camera state to UI after a delay.
+        Schedule a camera state send to the UI after a delay.
+        The send happens on the main thread from the UI update tick.
+        """
+        self._deferred_telemetry_deadline = time.monotonic() + delay
+
+    def process_deferred_telemetry(self):
         """
-        def send():
+        Send a scheduled camera state update once its deadline has passed.
+        Called from the main-thread UI update event.
+        """
+        deadline = self._deferred_telemetry_deadline
+        if deadline is None or time.monotonic() < deadline:
+            return
+        self._deferred_telemetry_deadline = None
+        try:
             constraints = self.get_distance_bounds() or {}
-            camera_telemetry.send_camera_state_to_ui(
+            self._last_sent_hash = camera_telemetry.send_camera_state_to_ui(
                 self.active_palette, app, adsk, None, None,
                 min_distance=constraints.get('min_distance'),
                 max_distance=constraints.get('max_distance')
             )
-        threading.Timer(delay, send).start()
+        except Exception:
+            pass
+
+    def pause_telemetry(self, data=None):
+        """
+        Pause camera telemetry while the user interacts with a UI control.
+        """
+        self.telemetry_paused = True
+
+    def resume_telemetry(self, data=None):
+        """
+        Resume camera telemetry after UI interaction.
+        """
+        self.telemetry_paused = False
+
+    def poll_camera_telemetry(self):
+        """
+        Periodic telemetry from the 30Hz UI tick.
+        Sends only when the camera moved, and checks at 15Hz once the camera has been idle for ~1s.
+        """
+        if not self.active_palette or self.telemetry_paused:
+            return
+        self._telemetry_tick += 1
+        if self._idle_ticks > IDLE_TICK_THRESHOLD and self._telemetry_tick % 2:
+            return
+        signature = self._camera_signature(app.activeViewport.camera)
+        if signature == self._last_camera_signature:
+            self._idle_ticks += 1
+            return
+        self._idle_ticks = 0
+        self._last_camera_signature = signature
+        self._last_values = {}  # Camera moved (orbit, named view, undo): cached slider values are stale
+        self.send_camera_state_to_ui()
+
+    @staticmethod
+    def _camera_signature(camera):
+        """
+        Cheap hash of the camera pose used to detect movement between telemetry ticks.
+        """
+        return hash(
+            tuple(round(v, 4) for v in (*camera.eye.asArray(), *camera.target.asArray(), *camera.upVector.asArray()))
+            + (round(camera.perspectiveAngle, 6), camera.cameraType)
+        )
 
     def send_camera_state_to_ui(self, eventArgs=None, force=False):
         """
         Send camera state to UI (palette).
+        Unchanged state is not re-sent unless force is set.
         """
         try:
-            if force or (self.active_palette and not getattr(self, 'telemetry_paused', False)):
+            if force or (self.active_palette and not self.telemetry_paused):
                 constraints = self.get_distance_bounds() or {}
-                camera_telemetry.send_camera_state_to_ui(
+                self._last_sent_hash = camera_telemetry.send_camera_state_to_ui(
                     self.active_palette, app, adsk, camera_calculations, camera_transforms,
                     min_distance=constraints.get('min_distance'),
-                    max_distance=constraints.get('max_distance')
+                    max_distance=constraints.get('max_distance'),
+                    last_sent_hash=None if force else self._last_sent_hash
                 )
         except Exception:
             pass
@@ -271,13 +446,9 @@ class CameraController:
 # SINGLETON INSTANCE
 # =========================
 
-_camera_controller_instance = None
-
+@functools.lru_cache(maxsize=1)
 def get_camera_controller():
     """
     Get the singleton CameraController instance.
     """
-    global _camera_controller_instance
-    if _camera_controller_instance is None:
-        _camera_controller_instance = CameraController()
-    return _camera_controller_instance
\ No newline at end of file
+    return CameraController()
\ No newline at end of file
@@ -1,37 +1,61 @@
 """
 EyeLevelController: Orchestrates all eye level operations using eye_level_utils and camera_commands.
 No direct camera writes. All camera changes go through the camera pipeline.
-Passive lock uses Fusion's cameraChanged event, not polling or threading.
+Passive lock uses Fusion's cameraChanged event with a trailing-edge custom event, not polling.
 """
 
 import adsk
 import adsk.fusion
+import functools
 import json
+import threading
 import time
+import weakref
+
+try:
+    import orjson  # Optional: faster parsing when available
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 LOG_MODULE = 'eye_level_controller'
 
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
-from ..utilities import eye_level_utils, camera_commands
+from ..utilities import eye_level_utils, camera_commands, event_hub
+from .camera_controller import get_camera_controller
+from .overlay_controller import get_overlay_controller
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 animate_eye_level = True
 
+# Custom event ID for main-thread passive correction after navigation settles
+CT_EYE_LEVEL_CORRECT_EVENT_ID = 'CameraTools_EyeLevelCorrectEvent'
+CORRECTION_SETTLE_TIME = 0.1  # Seconds of camera inactivity before correcting
+
+# Pre-encoded constant status payload
+_STATUS_DISABLED = '{"enabled": false}'
+
 # =========================
 # SUBCLASSES
 # =========================
 
-class PassiveEyeLevelCameraHandler(adsk.core.CameraEventHandler):
-    """Handles Fusion cameraChanged events for passive eye level correction."""
+class EyeLevelCorrectionEventHandler(adsk.core.CustomEventHandler):
+    """Runs deferred passive eye level correction (main thread safe)."""
     def __init__(self, controller):
         super().__init__()
-        self.controller = controller
+        self.controller = weakref.ref(controller)  # Weak to avoid a controller <-> handler cycle
 
     def notify(self, args):
-        self.controller._on_camera_changed(args)
+        controller = self.controller()
+        if controller is None:
+            return
+        try:
+            controller._on_correction_event()
+        except Exception:
+            pass  # Suppress errors for deferred correction
 
 # =========================
 # MAIN CONTROLLER
@@ -39,25 +63,18 @@ class PassiveEyeLevelCameraHandler(adsk.core.CameraEventHandler):
 
 class EyeLevelController:
     """Singleton controller for all eye level operations and state."""
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
 
     def __init__(self):
-        if self._initialized:
-            return
         self.lock_enabled = False
         self.target_eye_level = 0.0
         self.active_palette = None
         self.correction_tolerance = 0.1  # 1mm
-        self._last_camera_change = 0
-        self._camera_event = None
-        self._camera_event_handler = None
-        self._initialized = True
+        self._camera_subscription = None
+        self._range_subscription = None
+        self._correction_event = None
+        self._correction_event_handler = None
+        self._correction_deadline = None
+        self._correction_timer = None
 
     # =========================
     # PALETTE LIFECYCLE
@@ -68,20 +85,30 @@ class EyeLevelController:
         Initialize controller for the palette.
         """
         self.active_palette = palette
-        self.lock_enabled = False
+        self._set_lock_enabled(False)
         self.target_eye_level = 0.0
-        palette.sendInfoToHTML('eyeLevelLockStatus', json.dumps({'enabled': False}))
+        if self._range_subscription is None:
+            # Commands may edit geometry; re-read the model bounds for the eye level range afterwards
+            self._range_subscription = event_hub.subscribe(event_hub.COMMAND_TERMINATED, eye_level_utils.invalidate_eye_level_range)
+        palette.sendInfoToHTML('eyeLevelLockStatus', _STATUS_DISABLED)
 
     def cleanup_for_palette_close(self):
         """
         Cleanup controller state when palette closes.
         """
-        self.disable_eye_level_lock()
-        if self.active_palette:
-            self.active_palette.sendInfoToHTML('eyeLevelLockStatus', json.dumps({'enabled': False}))
-        self.active_palette = None
-        self.lock_enabled = False
-        self.target_eye_level = 0.0
+        try:
+            self._detach_camera_event()
+            self.disable_eye_level_lock()
+            if self.active_palette:
+                self.active_palette.sendInfoToHTML('eyeLevelLockStatus', _STATUS_DISABLED)
+            self._set_lock_enabled(False)
+            self.target_eye_level = 0.0
+            if self._range_subscription is not None:
+                event_hub.unsubscribe(self._range_subscription)
+                self._range_subscription = None
+            eye_level_utils.invalidate_eye_level_range()
+        finally:
+            self.active_palette = None
 
     def cleanup(self):
         """
@@ -100,7 +127,7 @@ class EyeLevelController:
         """
         try:
             if isinstance(data, str):
-                data = json.loads(data)
+                data = _json_loads(data)
             eye_level_value = float(data.get('eyeLevel', 0.0))
             should_snap = data.get('snap', False)
             self._update_eye_level_overlay(eye_level_value)
@@ -115,12 +142,12 @@ class EyeLevelController:
         """
         try:
             if isinstance(data, str):
-                data = json.loads(data)
+                data = _json_loads(data)
             is_enabled = data.get('enabled', False)
             target_eye_level = float(data.get('eyeLevel', 0.0))
             success = eye_level_utils.set_eye_level_lock_state(is_enabled, target_eye_level)
             if success:
-                self.lock_enabled = is_enabled
+                self._set_lock_enabled(is_enabled)
                 self.target_eye_level = target_eye_level
                 if is_enabled:
                     self.start_passive_eye_level_lock()
@@ -187,7 +214,7 @@ class EyeLevelController:
         Disable eye level lock and clear state.
         """
         eye_level_utils.set_eye_level_lock_state(False, 0.0)
-        self.lock_enabled = False
+        self._set_lock_enabled(False)
         self.target_eye_level = 0.0
         self.stop_passive_eye_level_lock()
 
@@ -201,9 +228,8 @@ class EyeLevelController:
         """
         try:
             self._detach_camera_event()
-            self._camera_event_handler = PassiveEyeLevelCameraHandler(self)
-            self._camera_event = app.cameraChanged
-            self._camera_event.add(self._camera_event_handler)
+            self._register_correction_event()
+            self._with_camera_event(install=True)
         except Exception:
             pass
 
@@ -212,24 +238,86 @@ class EyeLevelController:
         Detach cameraChanged event.
         """
         self._detach_camera_event()
+        self._unregister_correction_event()
+
+    def _with_camera_event(self, install):
+        """
+        Single place that subscribes to or unsubscribes from cameraChanged, so every add has a matching remove.
+        """
+        if install:
+            self._camera_subscription = event_hub.subscribe(event_hub.CAMERA_CHANGED, self._on_camera_changed)
+            return
+        try:
+            if self._camera_subscription is not None:
+                event_hub.unsubscribe(self._camera_subscription)
+        except Exception:
+            pass
+        self._camera_subscription = None
 
     def _detach_camera_event(self):
-        if (
-            hasattr(self, '_camera_event') and self._camera_event is not None and
-            hasattr(self, '_camera_event_handler') and self._camera_event_handler is not None
-        ):
+        if self._camera_subscription is not None:
+            self._with_camera_event(install=False)
+
+    def _register_correction_event(self):
+        """
+        Register the custom event used to run correction on the main thread.
+        """
+        if self._correction_event_handler is not None:
+            return
+        handler = EyeLevelCorrectionEventHandler(self)
+        self._correction_event = app.registerCustomEvent(CT_EYE_LEVEL_CORRECT_EVENT_ID)
+        self._correction_event.add(handler)
+        self._correction_event_handler = handler  # Keep a reference!
+
+    def _unregister_correction_event(self):
+        """
+        Cancel any pending correction and remove the custom event.
+        """
+        if self._correction_timer:
+            self._correction_timer.cancel()
+        self._correction_timer = None
+        self._correction_deadline = None
+        if self._correction_event is not None and self._correction_event_handler is not None:
             try:
-                self._camera_event.remove(self._camera_event_handler)
+                self._correction_event.remove(self._correction_event_handler)
+                app.unregisterCustomEvent(CT_EYE_LEVEL_CORRECT_EVENT_ID)
             except Exception:
                 pass
-            self._camera_event = None
-            self._camera_event_handler = None
+        self._correction_event = None
+        self._correction_event_handler = None
+
+    def _arm_correction_timer(self, delay):
+        """
+        Fire the correction custom event after delay seconds.
+        """
+        self._correction_timer = threading.Timer(
+            delay, app.fireCustomEvent, args=(CT_EYE_LEVEL_CORRECT_EVENT_ID, '')
+        )
+        self._correction_timer.daemon = True
+        self._correction_timer.start()
 
     def _on_camera_changed(self, args):
         """
-        Called on any camera change. Just update the timestamp and schedule correction.
+        Called on any camera change. Push back the correction deadline and arm the timer if idle.
         """
-        self._last_camera_change = time.time()
+        self._correction_deadline = time.monotonic() + CORRECTION_SETTLE_TIME
+        if self._correction_timer is None and self._correction_event_handler is not None:
+            self._arm_correction_timer(CORRECTION_SETTLE_TIME)
+
+    def _on_correction_event(self):
+        """
+        Correction event fired. Re-arm if navigation is still ongoing, otherwise correct once.
+        """
+        self._correction_timer = None
+        deadline = self._correction_deadline
+        if not self.lock_enabled or deadline is None:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            self._arm_correction_timer(remaining)
+            return
+        self._correction_deadline = None
+        self.check_and_apply_passive_correction()
 
     def check_and_apply_passive_correction(self):
         """
@@ -238,15 +326,11 @@ class EyeLevelController:
         """
         if not self.lock_enabled:
             return
-        now = time.time()
-        # Only correct if it's been >100ms since last camera change
-        if now - self._last_camera_change >= 0.1:
-            camera = app.activeViewport.camera
-            current_eye_level = eye_level_utils.get_eye_level(camera)
-            drift = abs(current_eye_level - self.target_eye_level)
-            if drift > self.correction_tolerance:
-                self.set_eye_level(eye_level=self.target_eye_level)  # Only move eye
-            self._last_camera_change = now
+        camera = app.activeViewport.camera
+        current_eye_level = eye_level_utils.get_eye_level(camera)
+        drift = abs(current_eye_level - self.target_eye_level)
+        if drift > self.correction_tolerance:
+            self.set_eye_level(eye_level=self.target_eye_level)  # Only move eye
 
     # =========================
     # OVERLAY/FEEDBACK
@@ -257,7 +341,6 @@ class EyeLevelController:
         Update overlay (stub for integration).
         """
         try:
-            from .overlay_controller import get_overlay_controller
             overlay_controller = get_overlay_controller()
             overlay_controller.current_eye_level_target = eye_level_value
         except Exception:
@@ -267,6 +350,13 @@ class EyeLevelController:
     # STATE/HELPERS
     # =========================
 
+    def _set_lock_enabled(self, enabled):
+        """
+        Update lock state and mirror it to the camera controller's hot path.
+        """
+        self.lock_enabled = enabled
+        get_camera_controller()._eye_lock_active = enabled
+
     def get_eye_level_lock_status(self):
         """
         Return current eye level lock status.
@@ -296,13 +386,9 @@ class EyeLevelController:
 # SINGLETON ACCESSOR
 # =========================
 
-_eye_level_controller_instance = None
-
+@functools.lru_cache(maxsize=1)
 def get_eye_level_controller():
     """
     Get the singleton EyeLevelController instance.
     """
-    global _eye_level_controller_instance
-    if _eye_level_controller_instance is None:
-        _eye_level_controller_instance = EyeLevelController()
-    return _eye_level_controller_instance
\ No newline at end of file
+    return EyeLevelController()
\ No newline at end of file
@@ -5,17 +5,55 @@ Delegates rendering and state to overlay_utils. Handles palette lifecycle and UI
 
 import adsk
 import adsk.fusion
+import functools
+import threading
+import time
+import weakref
 
 LOG_MODULE = 'overlay_controller'
 
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
-from ..utilities import overlay_utils, prefs_utils
+from ..utilities import overlay_utils, prefs_utils, event_hub
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
+GRID_PREF_KEYS = {
+    'halves': 'gridHalves',
+    'thirds': 'gridThirds',
+    'quarters': 'gridQuarters'
+}
+RESIZE_SETTLE_TIME = 0.1  # Seconds a new viewport size must hold before overlays repaint
+
+# Custom event ID for the coalesced main-thread overlay repaint
+CT_OVERLAY_REPAINT_EVENT_ID = 'CameraTools_OverlayRepaintEvent'
+REPAINT_COALESCE_TIME = 0.016  # Seconds of quiet (about one frame) before a requested repaint runs
+
+# =========================
+# SUBCLASSES
+# =========================
+
+class OverlayRepaintEventHandler(adsk.core.CustomEventHandler):
+    """Runs the coalesced overlay repaint (main thread safe)."""
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = weakref.ref(controller)  # Weak to avoid a controller <-> handler cycle
+
+    def notify(self, args):
+        controller = self.controller()
+        if controller is None:
+            return
+        try:
+            controller._on_repaint_event()
+        except Exception:
+            pass  # Suppress errors for deferred repaint
+
+# =========================
+# MAIN CLASS
+# =========================
+
 class OverlayController:
     """
     Manages all visual overlays and grid systems by delegating to overlay_utils global functions.
@@ -25,19 +63,102 @@ class OverlayController:
         self.previous_viewport_width = 0
         self.previous_viewport_height = 0
         self.active_palette = None
+        self._size_dirty = True
+        self._pending_size = None
+        self._resize_deadline = 0.0
+        self._camera_subscription = None
+        self._repaint_event = None
+        self._repaint_event_handler = None
+        self._repaint_timer = None
+        self._repaint_pending = False
+
+    def _register_repaint_event(self):
+        """
+        Register the custom event used to run coalesced repaints on the main thread,
+        and route overlay_utils repaint requests through it.
+        """
+        if self._repaint_event_handler is not None:
+            return
+        handler = OverlayRepaintEventHandler(self)
+        self._repaint_event = app.registerCustomEvent(CT_OVERLAY_REPAINT_EVENT_ID)
+        self._repaint_event.add(handler)
+        self._repaint_event_handler = handler  # Keep a reference!
+        overlay_utils.repaint_scheduler = self.schedule_repaint
+
+    def _unregister_repaint_event(self):
+        """
+        Cancel any pending repaint, remove the custom event and fall back to immediate repaints.
+        """
+        overlay_utils.repaint_scheduler = None
+        if self._repaint_timer:
+            self._repaint_timer.cancel()
+        self._repaint_timer = None
+        self._repaint_pending = False
+        if self._repaint_event is not None and self._repaint_event_handler is not None:
+            try:
+                self._repaint_event.remove(self._repaint_event_handler)
+                app.unregisterCustomEvent(CT_OVERLAY_REPAINT_EVENT_ID)
+            except Exception:
+                pass
+        self._repaint_event = None
+        self._repaint_event_handler = None
+
+    def schedule_repaint(self):
+        """
+        Request an overlay repaint; requests arriving within REPAINT_COALESCE_TIME of each other
+        are drained by one repaint on the trailing edge.
+        """
+        self._repaint_pending = True
+        if self._repaint_timer is not None:
+            self._repaint_timer.cancel()
+        self._repaint_timer = threading.Timer(
+            REPAINT_COALESCE_TIME, app.fireCustomEvent, args=(CT_OVERLAY_REPAINT_EVENT_ID, '')
+        )
+        self._repaint_timer.daemon = True
+        self._repaint_timer.start()
+
+    def _on_repaint_event(self):
+        """
+        Main-thread drain for schedule_repaint.
+        """
+        self._repaint_timer = None
+        if not self._repaint_pending:
+            return
+        self._repaint_pending = False
+        self.repaint_all_overlays()
+
+    def _on_camera_changed(self, args):
+        """
+        Mark the cached viewport size as stale; Fusion reports viewport resizes through cameraChanged.
+        """
+        self._size_dirty = True
 
     def poll_viewport_size_change(self):
         """
         Check if viewport size changed and repaint overlays if needed.
+        Only re-reads the viewport size after a camera/viewport change, and waits for
+        a resize drag to settle so only the final size triggers a repaint.
         """
+        if not self._size_dirty:
+            return
         viewport = app.activeViewport
-        current_width = viewport.width
-        current_height = viewport.height
-        if (self.previous_viewport_width != current_width or 
-            self.previous_viewport_height != current_height):
-            self.handle_viewport_size_change(current_width, current_height)
-            self.previous_viewport_width = current_width
-            self.previous_viewport_height = current_height
+        current_size = (viewport.width, viewport.height)
+        if current_size == (self.previous_viewport_width, self.previous_viewport_height):
+            self._size_dirty = False
+            self._pending_size = None
+            return
+        now = time.monotonic()
+        if current_size != self._pending_size:
+            # Size still moving: restart the settle window and keep polling
+            self._pending_size = current_size
+            self._resize_deadline = now + RESIZE_SETTLE_TIME
+            return
+        if now < self._resize_deadline:
+            return
+        self._size_dirty = False
+        self._pending_size = None
+        self.handle_viewport_size_change(*current_size)
+        self.previous_viewport_width, self.previous_viewport_height = current_size
 
     def handle_aspect_ratio_change(self, data, palette=None):
         """
@@ -45,9 +166,7 @@ class OverlayController:
         """
         try:
             aspect_ratio = data.get('aspectRatio', 'default')
-            preferences = prefs_utils.load_prefs() or {}
-            preferences["aspectRatio"] = aspect_ratio
-            prefs_utils.save_prefs(preferences)
+            prefs_utils.update_prefs({"aspectRatio": aspect_ratio})
             overlay_utils.set_aspect_ratio(aspect_ratio)
         except Exception:
             pass
@@ -69,14 +188,9 @@ class OverlayController:
         try:
             overlay_type = data.get('type')
             enabled = data.get('enabled', False)
-            preferences = prefs_utils.load_prefs() or {}
-            if overlay_type == 'halves':
-                preferences["gridHalves"] = enabled
-            elif overlay_type == 'thirds':
-                preferences["gridThirds"] = enabled
-            elif overlay_type == 'quarters':
-                preferences["gridQuarters"] = enabled
-            prefs_utils.save_prefs(preferences)
+            pref_key = GRID_PREF_KEYS.get(overlay_type)
+            if pref_key:
+                prefs_utils.update_prefs({pref_key: enabled})
             overlay_utils.set_grid_overlay(overlay_type, enabled)
         except Exception:
             pass
@@ -119,10 +233,15 @@ class OverlayController:
         Cleanup overlay controller for palette close.
         """
         try:
+            self._unregister_repaint_event()
             self.clear_all_overlays()
-            self.active_palette = None
+            if self._camera_subscription is not None:
+                event_hub.unsubscribe(self._camera_subscription)
         except Exception:
             pass
+        finally:
+            self._camera_subscription = None
+            self.active_palette = None
 
     def cleanup(self):
         """
@@ -135,6 +254,13 @@ class OverlayController:
         Initialize overlay controller for palette.
         """
         self.active_palette = palette
+        self._size_dirty = True
+        try:
+            self._register_repaint_event()
+        except Exception:
+            pass  # Without the custom event overlay_utils repaints immediately
+        if self._camera_subscription is None:
+            self._camera_subscription = event_hub.subscribe(event_hub.CAMERA_CHANGED, self._on_camera_changed)
 
     def handle_viewport_size_change(self, width, height):
         """
@@ -149,13 +275,9 @@ class OverlayController:
 # SINGLETON INSTANCE
 # =========================
 
-_overlay_controller_instance = None
-
+@functools.lru_cache(maxsize=1)
 def get_overlay_controller():
     """
     Get the singleton OverlayController instance.
     """
-    global _overlay_controller_instance
-    if _overlay_controller_instance is None:
-        _overlay_controller_instance = OverlayController()
-    return _overlay_controller_instance
\ No newline at end of file
+    return OverlayController()
\ No newline at end of file
@@ -1,11 +1,12 @@
 """
 UI Controller - orchestrates all user interface updates, palette communication, and UI state.
 Manages timers, UI state, and coordinates between domain controllers and UI.
-Uses Fusion-safe custom event timer for high-frequency camera telemetry,
-and timer_manager (idle event) for overlay and named view polling.
+Uses Fusion-safe custom event timers: a 30Hz tick for camera telemetry,
+and a separate low frequency tick for overlay and named view polling.
 """
 
 import adsk
+import functools
 import json
 import threading
 import time
@@ -16,15 +17,36 @@ LOG_MODULE = 'ui_controller'
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
+from ..utilities import camera_telemetry, eye_level_utils, prefs_utils
+from .camera_controller import get_camera_controller
+from .overlay_controller import get_overlay_controller
+from .view_controller import get_view_controller
+
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-# Custom event ID for main-thread UI updates
+# Custom event IDs for main-thread UI updates: camera telemetry and low frequency polling
 CT_UI_UPDATE_EVENT_ID = 'CameraTools_UIUpdateEvent'
+CT_LOW_FREQ_TICK_EVENT_ID = 'CameraTools_LowFreqTickEvent'
 _ui_update_thread = None
 _ui_update_stop_event = None
 _ui_update_event_registered = False
-_ui_update_event_handler = None
+_ui_update_event_handlers = []
+
+# Set while no tick is queued; the thread only fires a new tick once the previous one ran
+_tick_in_flight = threading.Event()
+_tick_in_flight.set()
+_low_freq_in_flight = threading.Event()
+_low_freq_in_flight.set()
+TICK_PERIOD = 1.0 / 30  # 30Hz
+TICK_STALL_TIMEOUT = 1.0  # Re-fire if a queued tick was never delivered
+HIDDEN_PROBE_PERIOD = 0.5  # While the palette is hidden, only probe visibility at 2Hz
+
+# Compact JSON for palette messages (no padding spaces)
+_JSON_SEPARATORS = (',', ':')
+
+# Low frequency tick fires every 5th camera tick (6Hz); its two pollers alternate, 3Hz each
+LOW_FREQ_EVERY = 5
 
 class UIState:
     """Manages UI state for consistency and viewport tracking."""
@@ -42,46 +64,67 @@ class UIState:
     def reset(self):
         self._initialize_defaults()
 
-class UIUpdateEventHandler(adsk.core.CustomEventHandler):
-    """Handles periodic UI update events (main thread safe)."""
-    def __init__(self):
+class _PaletteTickHandler(adsk.core.CustomEventHandler):
+    """Base for periodic tick handlers: runs the poll callable while the palette is visible, then releases the tick."""
+    def __init__(self, in_flight, poll):
         super().__init__()
-        self._last_named_view_poll = 0
+        self._in_flight = in_flight
+        self._poll_tick = poll
+        # Controllers are singletons; resolve them once instead of on every tick
+        self._ui = get_ui_controller()
 
     def notify(self, eventArgs):
         try:
-            from .ui_controller import get_ui_controller
-            ui_controller = get_ui_controller()
-            if not ui_controller.active_palette or not ui_controller.active_palette.isVisible:
-                return
-            from .camera_controller import get_camera_controller
-            from .overlay_controller import get_overlay_controller
-            from .view_controller import get_view_controller
-
-            # High frequency polling (30Hz)
-            get_camera_controller().send_camera_state_to_ui()
-
-            # Low frequency polling (3Hz)
-            now = time.time()
-            if now - self._last_named_view_poll > 0.3:  # 3Hz
-                get_view_controller().poll_named_views_update()
-                get_overlay_controller().poll_viewport_size_change()
-                from .eye_level_controller import get_eye_level_controller
-                get_eye_level_controller().check_and_apply_passive_correction()
-                self._last_named_view_poll = now
+            palette = self._ui.active_palette
+            visible = bool(palette and palette.isVisible)
+            self._ui.palette_visible = visible  # Read by the tick thread, which must not touch the Fusion API
+            if visible:
+                self._poll_tick()
+        finally:
+            self._in_flight.set()
+
+class UIUpdateEventHandler(_PaletteTickHandler):
+    """Handles 30Hz camera telemetry ticks (main thread safe)."""
+    def __init__(self):
+        super().__init__(_tick_in_flight, self._poll)
+        self._camera = get_camera_controller()
+
+    def _poll(self):
+        try:
+            self._camera.poll_camera_telemetry()
+            self._camera.process_deferred_telemetry()
+        except Exception as e:
+            log_utils.log(app, f'❌ Camera telemetry tick failed: {str(e)}', level='ERROR', module=LOG_MODULE)
 
-        except Exception:
-            pass  # Suppress errors for periodic UI update
+class LowFreqTickEventHandler(_PaletteTickHandler):
+    """Handles low frequency polling ticks (main thread safe), alternating pollers so they never share a tick."""
+    def __init__(self):
+        super().__init__(_low_freq_in_flight, self._poll)
+        self._view = get_view_controller()
+        self._overlay = get_overlay_controller()
+        self._poll_named_views = True
+
+    def _poll(self):
+        try:
+            if self._poll_named_views:
+                self._view.poll_named_views_update()
+            else:
+                self._overlay.poll_viewport_size_change()
+        except Exception as e:
+            log_utils.log(app, f'❌ Low frequency tick failed: {str(e)}', level='ERROR', module=LOG_MODULE)
+        finally:
+            self._poll_named_views = not self._poll_named_views
 
 def register_ui_update_event():
-    """Register the custom event for UI updates."""
-    global _ui_update_event_registered, _ui_update_event_handler
+    """Register the custom events for camera and low frequency UI updates."""
+    global _ui_update_event_registered
     if _ui_update_event_registered:
         return
-    handler = UIUpdateEventHandler()
-    custom_event = app.registerCustomEvent(CT_UI_UPDATE_EVENT_ID)
-    custom_event.add(handler)
-    _ui_update_event_handler = handler  # Keep a reference!
+    for event_id, handler in ((CT_UI_UPDATE_EVENT_ID, UIUpdateEventHandler()),
+                              (CT_LOW_FREQ_TICK_EVENT_ID, LowFreqTickEventHandler())):
+        custom_event = app.registerCustomEvent(event_id)
+        custom_event.add(handler)
+        _ui_update_event_handlers.append(handler)  # Keep a reference!
     _ui_update_event_registered = True
 
 def start_ui_update_timer():
@@ -89,11 +132,37 @@ def start_ui_update_timer():
     global _ui_update_thread, _ui_update_stop_event
     if _ui_update_thread and _ui_update_thread.is_alive():
         return  # Already running
-    _ui_update_stop_event = threading.Event()
+    stop_event = _ui_update_stop_event = threading.Event()
+    ui_controller = get_ui_controller()
+    _tick_in_flight.set()
+    _low_freq_in_flight.set()
+    def fire(event_id, in_flight, now, last_fire):
+        # Returns the new last fire time; skips while the previous tick is still queued
+        if in_flight.is_set() or now - last_fire > TICK_STALL_TIMEOUT:
+            in_flight.clear()
+            app.fireCustomEvent(event_id, '')
+            return now
+        return last_fire
     def run():
-        while _ui_update_stop_event is not None and not _ui_update_stop_event.is_set():
-            app.fireCustomEvent(CT_UI_UPDATE_EVENT_ID, '')
-            time.sleep(1.0 / 30)  # 30Hz
+        last_camera_fire = 0.0
+        last_low_freq_fire = 0.0
+        iteration = 0
+        # Bound to this thread's own stop event, so a restart never revives a stopped loop
+        while not stop_event.is_set():
+            if ui_controller.active_palette is None:
+                stop_event.wait(HIDDEN_PROBE_PERIOD)
+                continue  # Palette closed: never fire, only a plain attribute read per probe
+            now = time.monotonic()
+            if not ui_controller.palette_visible:
+                # Hidden or minimized: one camera tick re-checks visibility on the main thread, then back off
+                last_camera_fire = fire(CT_UI_UPDATE_EVENT_ID, _tick_in_flight, now, last_camera_fire)
+                stop_event.wait(HIDDEN_PROBE_PERIOD)
+                continue
+            last_camera_fire = fire(CT_UI_UPDATE_EVENT_ID, _tick_in_flight, now, last_camera_fire)
+            if iteration == 0:
+                last_low_freq_fire = fire(CT_LOW_FREQ_TICK_EVENT_ID, _low_freq_in_flight, now, last_low_freq_fire)
+            iteration = (iteration + 1) % LOW_FREQ_EVERY
+            stop_event.wait(TICK_PERIOD)  # Returns immediately when stopped
     _ui_update_thread = threading.Thread(target=run, daemon=True)
     _ui_update_thread.start()
 
@@ -107,22 +176,14 @@ def stop_ui_update_timer():
 class UIController:
     """Unified UI controller - handles all UI orchestration and state."""
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
 
     def __init__(self):
-        if self._initialized:
-            return
         self.ui_state = UIState()
         self.active_palette = None
+        self.palette_visible = False
         self.lock_enabled = False
         self.target_eye_level = None
-        self._initialized = True
+        self._message_batch = None
 
     # =========================
     # PALETTE LIFECYCLE
@@ -132,7 +193,7 @@ class UIController:
         """Initialize UI controller for palette."""
         try:
             self.active_palette = palette
-            from ..utilities import eye_level_utils
+            self.palette_visible = True
             lock_status = eye_level_utils.get_eye_level_lock_status()
             self.lock_enabled = lock_status['enabled']
             self.target_eye_level = lock_status['target_level']
@@ -148,9 +209,10 @@ class UIController:
         try:
             stop_ui_update_timer()
             self.ui_state = UIState()
-            self.active_palette = None
         except Exception:
             pass
+        finally:
+            self.active_palette = None
 
     def cleanup_all_timers(self):
         """Stop all UI timers."""
@@ -175,17 +237,38 @@ class UIController:
     def send_data_to_palette(self, action, data):
         """Send data to palette with error handling."""
         try:
+            return self.send_serialized_to_palette(action, json.dumps(data, separators=_JSON_SEPARATORS))
+        except Exception:
+            return False
+
+    def send_serialized_to_palette(self, action, data_json):
+        """Send an already JSON-encoded payload to palette with error handling."""
+        try:
+            if self._message_batch is not None:
+                self._message_batch.append((action, data_json))
+                return True
             if self.active_palette and self.active_palette.isVisible:
-                payload = {
-                    "action": action,
-                    "data": data
-                }
-                self.active_palette.sendInfoToHTML(payload["action"], json.dumps(payload["data"]))
+                self.active_palette.sendInfoToHTML(action, data_json)
                 return True
             return False
         except Exception:
             return False
 
+    def begin_message_batch(self):
+        """Queue palette messages until flush_message_batch, so bursts cross the HTML bridge once."""
+        if self._message_batch is None:
+            self._message_batch = []
+
+    def flush_message_batch(self):
+        """Send queued palette messages as a single 'bulk' message (or directly if only one)."""
+        batch = self._message_batch
+        self._message_batch = None
+        if not batch:
+            return True
+        if len(batch) == 1:
+            return self.send_serialized_to_palette(*batch[0])
+        return self.send_serialized_to_palette('bulk', json.dumps(batch, separators=_JSON_SEPARATORS))
+
     # =========================
     # DOCUMENT EVENTS
     # =========================
@@ -193,15 +276,12 @@ class UIController:
     def handle_document_activation(self, palette):
         """Handle document activation - coordinate UI updates."""
         try:
-            from ..utilities import prefs_utils
             prefs_utils.send_prefs(palette)
-            from .camera_controller import get_camera_controller
             camera_controller = get_camera_controller()
             camera_controller.update_distance_bounds()
-            from ..utilities import camera_telemetry
             camera_telemetry.send_current_camera_data(palette, force=True)
-            from .view_controller import get_view_controller
             view_controller = get_view_controller()
+            view_controller.mark_named_views_dirty()
             view_controller.populate_named_views_dropdown(palette)
             self.ui_state.cached_view_names = None
             self.ui_state.last_document_id = None
@@ -217,7 +297,6 @@ class UIController:
         try:
             if not self.ui_state.viewport_repaint_in_progress:
                 self.ui_state.viewport_repaint_in_progress = True
-                from .overlay_controller import get_overlay_controller
                 overlay_controller = get_overlay_controller()
                 overlay_controller.repaint_all_overlays()
                 self.ui_state.viewport_repaint_in_progress = False
@@ -232,10 +311,7 @@ class UIController:
         """Handle dark mode preference changes."""
         try:
             is_enabled = data.get('enabled')
-            from ..utilities import prefs_utils
             preferences = prefs_utils.load_prefs()
-            if preferences is None:
-                preferences = {}
             preferences["darkMode"] = is_enabled
             prefs_utils.save_prefs(preferences)
         except Exception:
@@ -260,11 +336,7 @@ class UIController:
 # SINGLETON INSTANCE
 # =========================
 
-_ui_controller_instance = None
-
+@functools.lru_cache(maxsize=1)
 def get_ui_controller():
     """Get the UI controller singleton."""
-    global _ui_controller_instance
-    if _ui_controller_instance is None:
-        _ui_controller_instance = UIController()
-    return _ui_controller_instance
\ No newline at end of file
+    return UIController()
\ No newline at end of file
@@ -4,6 +4,7 @@ Delegates view logic to view_utils. Manages palette lifecycle, UI events, and sy
 """
 
 import adsk
+import functools
 import traceback
 
 LOG_MODULE = 'view_controller'
@@ -11,51 +12,25 @@ LOG_MODULE = 'view_controller'
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
-from ..utilities import view_utils
+from ..utilities import view_utils, event_hub
 from ..utilities.view_utils import apply_named_view_by_index
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
 _named_view_selected = False
-handlers = []
-
-class NamedViewCameraChangedHandler(adsk.core.CameraEventHandler):
-    """Handles Fusion cameraChanged events for named view dropdown reset."""
-    def __init__(self, palette):
-        super().__init__()
-        self.palette = palette
-
-    def notify(self, args):
-        global _named_view_selected
-        if _named_view_selected:
-            _named_view_selected = False
-            if self.palette:
-                self.palette.sendInfoToHTML('resetNamedViewDropdown', '{}')
-
-def register_camera_changed_handler(palette):
-    """Register cameraChanged handler for named view sync."""
-    global handlers
-    handler = NamedViewCameraChangedHandler(palette)
-    app.cameraChanged.add(handler)
-    handlers.append(handler)
+_EMPTY_JSON = '{}'
 
 class ViewController:
     """Unified view controller - handles all view operations and sync."""
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
 
     def __init__(self):
-        if self._initialized:
-            return
         self.active_palette = None
         self._cached_named_views = None
-        self._initialized = True
+        self._cached_named_views_digest = None
+        self._named_views_dirty = True
+        self._camera_subscription = None
+        self._named_view_subscriptions = []
 
     # =========================
     # PALETTE LIFECYCLE
@@ -66,7 +41,13 @@ class ViewController:
         try:
             self.active_palette = palette
             self.populate_named_views_dropdown(palette)
-            register_camera_changed_handler(palette)
+            if not self._named_view_subscriptions:
+                # Named views have no change event; saves and finished commands (create/rename/delete) mark them dirty
+                self._named_view_subscriptions = [
+                    event_hub.subscribe(event_hub.DOCUMENT_SAVED, self.mark_named_views_dirty),
+                    event_hub.subscribe(event_hub.COMMAND_TERMINATED, self.mark_named_views_dirty)
+                ]
+            self._named_views_dirty = True
             log_utils.log(app, '✅ View controller initialized for palette', level='INFO', module=LOG_MODULE)
         except Exception as e:
             log_utils.log(app, f'❌ Failed to initialize view controller: {str(e)}', level='ERROR', module=LOG_MODULE)
@@ -74,15 +55,16 @@ class ViewController:
     def cleanup_for_palette_close(self):
         """Cleanup view controller for palette close."""
         try:
-            self.active_palette = None
             self._cached_named_views = None
-            global handlers
-            for handler in handlers:
-                app.cameraChanged.remove(handler)
-            handlers.clear()
+            self._unsubscribe_camera()
+            for token in self._named_view_subscriptions:
+                event_hub.unsubscribe(token)
+            self._named_view_subscriptions = []
             log_utils.log(app, '✅ View controller cleaned up for palette close', level='INFO', module=LOG_MODULE)
         except Exception as e:
             log_utils.log(app, f'❌ Failed to cleanup view controller: {str(e)}', level='ERROR', module=LOG_MODULE)
+        finally:
+            self.active_palette = None
 
     def cleanup(self):
         """Full cleanup for view controller."""
@@ -92,6 +74,20 @@ class ViewController:
     # UI EVENT HANDLERS
     # =========================
 
+    def _on_camera_changed(self, args):
+        """Reset the named view dropdown once the camera moves away from a selected view."""
+        global _named_view_selected
+        _named_view_selected = False
+        self._unsubscribe_camera()  # Ordinary navigation needs no handler until a view is selected again
+        palette = self.active_palette
+        if palette:
+            palette.sendInfoToHTML('resetNamedViewDropdown', _EMPTY_JSON)
+
+    def _unsubscribe_camera(self):
+        if self._camera_subscription is not None:
+            event_hub.unsubscribe(self._camera_subscription)
+            self._camera_subscription = None
+
     def handle_view_copy(self, data, palette=None):
         """Handle view copy operation."""
         try:
@@ -126,6 +122,8 @@ class ViewController:
         global _named_view_selected
         _named_view_selected = True
         try:
+            if self._camera_subscription is None:
+                self._camera_subscription = event_hub.subscribe(event_hub.CAMERA_CHANGED, self._on_camera_changed)
             view_index = data.get('viewIndex')
             apply_named_view_by_index(view_index, palette)
             log_utils.log(app, f'Named view selected: {view_index}', level='INFO', module=LOG_MODULE)
@@ -146,18 +144,32 @@ class ViewController:
         try:
             self.populate_named_views_dropdown(palette)
             self._cached_named_views = None
+            self._named_views_dirty = True
             log_utils.log(app, '✅ Document activation handled - named views refreshed', level='INFO', module=LOG_MODULE)
         except Exception as e:
             log_utils.log(app, f'❌ Failed to handle document activation: {str(e)}', level='ERROR', module=LOG_MODULE)
 
+    def mark_named_views_dirty(self, args=None):
+        """Flag named views for re-check on the next poll."""
+        self._named_views_dirty = True
+        view_utils.invalidate_named_views_cache()  # A command may have renamed a view without changing the count
+
     def poll_named_views_update(self, palette=None):
         """Poll for named views update and refresh dropdown if changed."""
-        from ..utilities.view_utils import get_named_views_list
-        current_views = get_named_views_list()
+        view_utils.flush_pending_named_views_populate(palette)
+        if not self._named_views_dirty:
+            return
+        self._named_views_dirty = False
+        digest = view_utils.get_named_views_digest()
+        if self._cached_named_views is not None and digest == self._cached_named_views_digest:
+            return
+        current_views = view_utils.get_named_views_list()
         if current_views != self._cached_named_views:
             log_utils.log(app, f'Named views changed: {current_views}', level='INFO', module=LOG_MODULE)
             self._cached_named_views = current_views
+            view_utils.invalidate_named_views_cache()
             self.populate_named_views_dropdown(palette)
+        self._cached_named_views_digest = digest
 
     # =========================
     # SYNC MANAGEMENT
@@ -190,11 +202,7 @@ class ViewController:
 # SINGLETON INSTANCE
 # =========================
 
-_view_controller_instance = None
-
+@functools.lru_cache(maxsize=1)
 def get_view_controller():
     """Get the singleton ViewController instance."""
-    global _view_controller_instance
-    if _view_controller_instance is None:
-        _view_controller_instance = ViewController()
-    return _view_controller_instance
\ No newline at end of file
+    return ViewController()
\ No newline at end of file
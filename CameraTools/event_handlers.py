@@ -12,19 +12,122 @@ NOTE: Palette close is always triggered via a custom UI button,
 
 import adsk  # type: ignore
 import json
+import operator
 import traceback
 
+try:
+    import orjson  # Optional: faster parsing when available
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 LOG_MODULE = 'event_handlers'
 
 from .utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Disable verbose logging for deployment
 
 from .utilities import prefs_utils
+from .controllers.camera_controller import get_camera_controller
+from .controllers.eye_level_controller import get_eye_level_controller
+from .controllers.overlay_controller import get_overlay_controller
+from .controllers.ui_controller import get_ui_controller
+from .controllers.view_controller import get_view_controller
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 event_handlers_list = []
 
+# Single controller registry, in palette init order; cleanup walks it in the same order so UI ticks stop first
+CONTROLLER_GETTERS = (
+    get_ui_controller,
+    get_camera_controller,
+    get_view_controller,
+    get_eye_level_controller,
+    get_overlay_controller
+)
+
+# Action -> handler method name (bound once per handler instance, not per event).
+# Dotted names such as '_camera.pause_telemetry' bind a controller method directly, skipping a trampoline frame.
+_ACTION_ROUTES = {
+    # Palette lifecycle
+    'paletteReady': 'handle_palette_ready',
+    'closePalette': 'handle_palette_close',
+
+    # UI interaction tracking
+    'pauseTelemetry': '_camera.pause_telemetry',
+    'resumeTelemetry': '_camera.resume_telemetry',
+
+    # Camera operations
+    'updateCameraData': '_camera.send_camera_state_to_ui',
+    'fusionDefault': 'handle_fusion_default_lens',
+
+    # Advanced camera operations
+    'setEye': 'handle_set_eye',
+    'setTarget': 'handle_set_target',
+
+    # Eye level operations
+    'setEyeLevel': 'handle_eye_level_value_change',
+    'lockEyeLevel': 'handle_eye_level_lock',
+    'toggleEyeLevelLock': 'handle_eye_level_lock_toggle',
+    'updateEyeLevelIndicator': 'handle_eye_level_indicator_update',
+
+    # View operations
+    'namedViewSelected': 'handle_named_view_selection',
+    'populateNamedViews': 'handle_named_views_population',
+    'checkNamedViewSync': 'handle_named_view_sync_check',
+    'saveView': 'handle_named_view_save',
+    'copyView': 'handle_view_copy',
+    'pasteView': 'handle_view_paste',
+    'resetView': 'handle_view_reset',
+    'fitToView': 'handle_view_fit',
+
+    # Overlay operations
+    'aspectRatioChanged': 'handle_aspect_ratio_change',
+    'setGridOverlay': 'handle_set_grid_overlay',
+
+    # UI preferences
+    'darkModeChanged': '_ui.handle_dark_mode_change',
+    'logMessage': 'handle_log_message',
+    'htmlTest': 'handle_html_test',
+    'response': 'handle_ui_response'
+}
+
+# Actions whose handlers ignore the payload: skip JSON decoding entirely
+_NO_PAYLOAD_ACTIONS = frozenset({
+    'paletteReady', 'closePalette', 'pauseTelemetry', 'resumeTelemetry',
+    'updateCameraData', 'logMessage', 'htmlTest', 'response'
+})
+
+# Numeric camera property actions -> (property name, force), dispatched straight to the camera controller
+_PROPERTY_ACTIONS = {
+    'cameraTypeChanged': ('cameraType', True),
+    'distanceChanged': ('distance', False),
+    'azimuthChanged': ('azimuth', False),
+    'inclinationChanged': ('inclination', False),
+    'fovChanged': ('fov', False),
+    'dollyChanged': ('dolly', False),
+    'panChanged': ('pan', False),
+    'tiltChanged': ('tilt', False)
+}
+
+# Numeric slider actions: a bare number payload is parsed with float() before falling back to JSON
+_SCALAR_ACTIONS = frozenset(_PROPERTY_ACTIONS)
+
+def _parse_payload(action, data):
+    """
+    Decode an HTML event payload, doing only as much work as the action needs.
+    """
+    if action in _NO_PAYLOAD_ACTIONS:
+        return None
+    if not data:
+        return {}
+    if action in _SCALAR_ACTIONS:
+        try:
+            return float(data)
+        except ValueError:
+            pass
+    return _json_loads(data)
+
 class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
     """
     Handles incoming events from the HTML palette and routes them to controllers.
@@ -32,6 +135,13 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
     def __init__(self, palette):
         super().__init__()
         self.palette = palette
+        # Controllers are singletons; resolve them once instead of on every event
+        self._camera = get_camera_controller()
+        self._eye_level = get_eye_level_controller()
+        self._overlay = get_overlay_controller()
+        self._ui = get_ui_controller()
+        self._view = get_view_controller()
+        self._routes = {action: operator.attrgetter(name)(self) for action, name in _ACTION_ROUTES.items()}
 
     def notify(self, eventArgs):
         """
@@ -43,71 +153,28 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
             data = event_args.data
             action = event_args.action
 
-            # Action routing map
-            action_routing_map = {
-                # Palette lifecycle
-                'paletteReady': self.handle_palette_ready,
-                'closePalette': self.handle_palette_close,
-
-                # UI interaction tracking
-                'pauseTelemetry': self.handle_pause_telemetry,
-                'resumeTelemetry': self.handle_resume_telemetry,
-
-                # Camera operations
-                'updateCameraData': self.handle_sync_update_camera_data,
-                'cameraTypeChanged': self.handle_camera_type_change,
-                'distanceChanged': self.handle_distance_change,
-                'azimuthChanged': self.handle_azimuth_change,
-                'inclinationChanged': self.handle_inclination_change,
-                'fovChanged': self.handle_fov_change,
-                'fusionDefault': self.handle_fusion_default_lens,
-
-                # Advanced camera operations
-                'dollyChanged': self.handle_dolly_change,
-                'panChanged': self.handle_pan_change,
-                'tiltChanged': self.handle_tilt_change,
-                'setEye': self.handle_set_eye,
-                'setTarget': self.handle_set_target,
-
-                # Eye level operations
-                'setEyeLevel': self.handle_eye_level_value_change,
-                'lockEyeLevel': self.handle_eye_level_lock,
-                'toggleEyeLevelLock': self.handle_eye_level_lock_toggle,
-                'updateEyeLevelIndicator': self.handle_eye_level_indicator_update,
-
-                # View operations
-                'namedViewSelected': self.handle_named_view_selection,
-                'populateNamedViews': self.handle_named_views_population,
-                'checkNamedViewSync': self.handle_named_view_sync_check,
-                'saveView': self.handle_named_view_save,
-                'copyView': self.handle_view_copy,
-                'pasteView': self.handle_view_paste,
-                'resetView': self.handle_view_reset,
-                'fitToView': self.handle_view_fit,
-
-                # Overlay operations
-                'aspectRatioChanged': self.handle_aspect_ratio_change,
-                'setGridOverlay': self.handle_set_grid_overlay,
-
-                # UI preferences
-                'darkModeChanged': self.handle_dark_mode_change,
-                'logMessage': self.handle_log_message,
-                'htmlTest': self.handle_html_test,
-                'response': self.handle_ui_response
-            }
-
-            if action in action_routing_map:
-                try:
-                    action_data = json.loads(data) if data else {}
-                    action_routing_map[action](action_data)
-                except Exception as e:
-                    # Only log errors for debugging
+            handler = self._routes.get(action)
+            camera_property = _PROPERTY_ACTIONS.get(action) if handler is None else None
+            if handler is None and camera_property is None:
+                if log_utils.enabled(LOG_MODULE, 'WARNING'):
+                    log_utils.log(app, f'Unknown action: {action}', level='WARNING', module=LOG_MODULE)
+                return
+            try:
+                action_data = _parse_payload(action, data)
+                if handler is not None:
+                    handler(action_data)
+                else:
+                    property_name, force = camera_property
+                    value = self._extract_numeric(action_data, property_name)
+                    self.handle_camera_property_change(property_name, value, force=force)
+            except Exception as e:
+                # Only log errors for debugging
+                if log_utils.enabled(LOG_MODULE, 'ERROR'):
                     log_utils.log(app, f'Error handling action {action}: {e}', level='ERROR', module=LOG_MODULE)
-            else:
-                log_utils.log(app, f'Unknown action: {action}', level='WARNING', module=LOG_MODULE)
 
         except Exception as e:
-            log_utils.log(app, f'Error in palette event handler notify: {e}', level='ERROR', module=LOG_MODULE)
+            if log_utils.enabled(LOG_MODULE, 'ERROR'):
+                log_utils.log(app, f'Error in palette event handler notify: {e}', level='ERROR', module=LOG_MODULE)
 
     # ========== PALETTE LIFECYCLE HANDLERS ==========
 
@@ -116,11 +183,13 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
         Initialize controllers and send lock state/preferences to UI when palette is ready.
         """
         try:
-            _initialize_controllers_for_palette(self.palette)
-            from .controllers.eye_level_controller import get_eye_level_controller
-            eye_level_controller = get_eye_level_controller()
-            self.palette.sendInfoToHTML('eyeLevelLockStatus', json.dumps({'enabled': eye_level_controller.lock_enabled}))
-            prefs_utils.send_prefs(self.palette)
+            # Camera state, named views and prefs reach the palette as one bulk message
+            self._ui.begin_message_batch()
+            try:
+                _initialize_controllers_for_palette(self.palette)
+                prefs_utils.send_prefs(self.palette)
+            finally:
+                self._ui.flush_message_batch()
         except Exception as e:
             ui.messageBox(f'Failed to initialize palette:\n{traceback.format_exc()}')
 
@@ -129,101 +198,40 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
         Cleanup all controllers and state when palette is closed.
         """
         try:
-            from .controllers.overlay_controller import get_overlay_controller
-            get_overlay_controller().clear_all_overlays()
-            from .controllers.eye_level_controller import get_eye_level_controller
-            get_eye_level_controller().disable_eye_level_lock()
-            from .controllers.camera_controller import get_camera_controller
-            get_camera_controller().cleanup_for_palette_close()
-            from .controllers.view_controller import get_view_controller
-            get_view_controller().cleanup_for_palette_close()
-            from .controllers.ui_controller import get_ui_controller
-            get_ui_controller()
+            self._overlay.clear_all_overlays()
+            self._eye_level.disable_eye_level_lock()
+            self._camera.cleanup_for_palette_close()
+            self._view.cleanup_for_palette_close()
             if self.palette:
                 self.palette.isVisible = False
             cleanup_palette_global()
         except Exception as e:
-            ui.messageBox(f'Failed to close palette:\n{traceback.format_exc()}')
-
-    # ========== UI INTERACTION HANDLERS ==========
-
-    def handle_pause_telemetry(self, data):
-        """Pause camera telemetry updates."""
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().telemetry_paused = True
-
-    def handle_resume_telemetry(self, data):
-        """Resume camera telemetry updates."""
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().telemetry_paused = False
+            log_utils.log(app, f'❌ Failed to close palette: {str(e)}', level='ERROR', module=LOG_MODULE, exc_info=True)
 
     # ========== CAMERA OPERATION HANDLERS ==========
 
-    def handle_sync_update_camera_data(self, data):
-        """Send the current camera state to the UI (palette)."""
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().send_camera_state_to_ui()
-
-    def handle_camera_type_change(self, data):
-        value = self._extract_numeric(data, 'cameraType')
-        self.handle_camera_property_change('cameraType', value, force=True)
-
-    def handle_distance_change(self, data):
-        value = self._extract_numeric(data, 'distance')
-        self.handle_camera_property_change('distance', value)
-
-    def handle_azimuth_change(self, data):
-        value = self._extract_numeric(data, 'azimuth')
-        self.handle_camera_property_change('azimuth', value)
-
-    def handle_inclination_change(self, data):
-        value = self._extract_numeric(data, 'inclination')
-        self.handle_camera_property_change('inclination', value)
-
     def handle_set_eye(self, data):
         """Set the camera eye position from a selected construction point."""
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_set_eye(data, self.palette)
+        self._camera.handle_set_eye(data, self.palette)
 
     def handle_set_target(self, data):
         """Set the camera target position from a selected construction point."""
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_set_target(data, self.palette)
-
-    def handle_dolly_change(self, data):
-        value = self._extract_numeric(data, 'dolly')
-        self.handle_camera_property_change('dolly', value)
-
-    def handle_pan_change(self, data):
-        value = self._extract_numeric(data, 'pan')
-        self.handle_camera_property_change('pan', value)
-
-    def handle_tilt_change(self, data):
-        value = self._extract_numeric(data, 'tilt')
-        self.handle_camera_property_change('tilt', value)
-
-    def handle_fov_change(self, data):
-        value = self._extract_numeric(data, 'fov')
-        self.handle_camera_property_change('fov', value)
+        self._camera.handle_set_target(data, self.palette)
 
     def handle_camera_property_change(self, property_name, value, force=False):
         """
         Route camera property changes to the camera controller.
         """
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_camera_property_change(property_name, value, self.palette, force=force)
+        self._camera.handle_camera_property_change(property_name, value, self.palette, force=force)
 
     def handle_fusion_default_lens(self, data):
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_fusion_default_lens(data, self.palette)
+        self._camera.handle_fusion_default_lens(data, self.palette)
 
     def handle_view_fit(self, data):
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_view_fit(data, self.palette)
+        self._camera.handle_view_fit(data, self.palette)
 
     def handle_view_reset(self, data):
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().handle_view_reset(data, self.palette)
+        self._camera.handle_view_reset(data, self.palette)
 
     # ========== HELPERS ==========
 
@@ -231,6 +239,13 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
         """
         Extract a float value from data, supporting both dict and direct number.
         """
+        # Fast paths: a bare float from _parse_payload, or the {'value': N} slider shape
+        if data.__class__ is float:
+            return data
+        try:
+            return float(data['value'])
+        except (KeyError, TypeError):
+            pass
         if isinstance(data, (int, float)):
             return float(data)
         elif isinstance(data, dict):
@@ -241,63 +256,47 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
     # ========== EYE LEVEL HANDLERS ==========
 
     def handle_eye_level_value_change(self, data):
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().handle_eye_level_value_change(data, self.palette)
+        self._eye_level.handle_eye_level_value_change(data, self.palette)
 
     def handle_eye_level_lock(self, data):
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().handle_eye_level_lock(data, self.palette)
+        self._eye_level.handle_eye_level_lock(data, self.palette)
 
     def handle_eye_level_lock_toggle(self, data):
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().handle_eye_level_lock_toggle(data, self.palette)
+        self._eye_level.handle_eye_level_lock_toggle(data, self.palette)
 
     def handle_eye_level_indicator_update(self, data):
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().handle_eye_level_indicator_update(data, self.palette)
+        self._eye_level.handle_eye_level_indicator_update(data, self.palette)
 
     # ========== VIEW HANDLERS ==========
 
     def handle_named_view_selection(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_named_view_selected(data, self.palette)
+        self._view.handle_named_view_selected(data, self.palette)
 
     def handle_named_views_population(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_named_views_population(data, self.palette)
+        self._view.handle_named_views_population(data, self.palette)
 
     def handle_named_view_sync_check(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_named_view_sync_check(data, self.palette)
+        self._view.handle_named_view_sync_check(data, self.palette)
 
     def handle_named_view_save(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_named_view_save(data, self.palette)
+        self._view.handle_named_view_save(data, self.palette)
 
     def handle_view_copy(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_view_copy(data, self.palette)
+        self._view.handle_view_copy(data, self.palette)
 
     def handle_view_paste(self, data):
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().handle_view_paste(data, self.palette)
+        self._view.handle_view_paste(data, self.palette)
 
     # ========== OVERLAY HANDLERS ==========
 
     def handle_aspect_ratio_change(self, data):
-        from .controllers.overlay_controller import get_overlay_controller
-        get_overlay_controller().handle_aspect_ratio_change(data, self.palette)
+        self._overlay.handle_aspect_ratio_change(data, self.palette)
 
     def handle_set_grid_overlay(self, data):
-        from .controllers.overlay_controller import get_overlay_controller
-        get_overlay_controller().handle_set_grid_overlay(data, self.palette)
+        self._overlay.handle_set_grid_overlay(data, self.palette)
 
     # ========== UI PREFERENCE HANDLERS ==========
 
-    def handle_dark_mode_change(self, data):
-        from .controllers.ui_controller import get_ui_controller
-        get_ui_controller().handle_dark_mode_change(data)
-
     def handle_log_message(self, data):
         """Handle log messages from HTML (currently disabled)."""
         pass  # Disabled to reduce log noise
@@ -305,8 +304,7 @@ class PaletteIncomingEventHandler(adsk.core.HTMLEventHandler):
     def handle_html_test(self, data):
         """Handle HTML test button actions."""
         try:
-            from .controllers.overlay_controller import get_overlay_controller
-            get_overlay_controller().clear_all_overlays()
+            self._overlay.clear_all_overlays()
             ui.messageBox('HTML test button clicked!')
         except Exception:
             pass  # Suppress errors for test button
@@ -322,7 +320,6 @@ def handle_initial_camera_states():
     Handle initial camera states setup - delegate to camera controller.
     """
     try:
-        from .controllers.camera_controller import get_camera_controller
         get_camera_controller().handle_initial_camera_states()
     except Exception:
         pass
@@ -332,7 +329,6 @@ def check_and_apply_passive_eye_level_correction():
     Check and apply passive eye level correction - delegate to eye level controller.
     """
     try:
-        from .controllers.eye_level_controller import get_eye_level_controller
         get_eye_level_controller().check_and_apply_passive_correction()
     except Exception:
         pass
@@ -342,16 +338,8 @@ def _initialize_controllers_for_palette(palette_instance):
     Initialize all controllers for palette.
     """
     try:
-        from .controllers.ui_controller import get_ui_controller
-        get_ui_controller().initialize_for_palette(palette_instance)
-        from .controllers.camera_controller import get_camera_controller
-        get_camera_controller().initialize_for_palette(palette_instance)
-        from .controllers.view_controller import get_view_controller
-        get_view_controller().initialize_for_palette(palette_instance)
-        from .controllers.eye_level_controller import get_eye_level_controller
-        get_eye_level_controller().initialize_for_palette(palette_instance)
-        from .controllers.overlay_controller import get_overlay_controller
-        get_overlay_controller().initialize_for_palette(palette_instance)
+        for get_controller in CONTROLLER_GETTERS:
+            get_controller().initialize_for_palette(palette_instance)
     except Exception:
         pass
 
@@ -360,14 +348,8 @@ def cleanup_event_handlers():
     Clean up event handlers module - delegate to all controllers.
     """
     try:
-        from .controllers.camera_controller import get_camera_controller
-        from .controllers.eye_level_controller import get_eye_level_controller
-        from .controllers.view_controller import get_view_controller
-        from .controllers.overlay_controller import get_overlay_controller
-        get_camera_controller().cleanup()
-        get_eye_level_controller().cleanup()
-        get_view_controller().cleanup()
-        get_overlay_controller().cleanup()
+        for get_controller in CONTROLLER_GETTERS:
+            get_controller().cleanup()
     except Exception:
         pass
 
@@ -72,6 +72,10 @@ function handleIncomingData(action, data) {
                     handleLoadPrefs(msg.prefs ? { prefs: msg.prefs } : msg);
                 }
                 break;
+            case 'bulk':
+                // Several [action, data] messages sent in one bridge call
+                JSON.parse(data).forEach(([bulkAction, bulkData]) => handleIncomingData(bulkAction, bulkData));
+                break;
             case 'testAction':
                 break;
             default:
@@ -5,10 +5,17 @@ No Fusion API calls except for reading camera properties.
 All transforms are canonicalized to work with arbitrary document up directions.
 """
 
-import math
 import adsk
 import adsk.fusion
 import traceback
+from math import asin, atan, atan2, cos, degrees, hypot, radians, sin, sqrt, tan
+
+try:
+    from numba import njit  # Optional: native compile of the pure-float kernels when available
+    _kernel = njit(cache=True)
+except ImportError:
+    def _kernel(fn):
+        return fn
 
 LOG_MODULE = 'camera_calculations'
 
@@ -17,43 +24,213 @@ log_utils.set_module_logging(LOG_MODULE, False)  # Set True for debugging
 
 from ..utilities import camera_transforms
 
+# Pre-bound constructors for the interactive drag paths
+_create_point = adsk.core.Point3D.create
+_create_vector = adsk.core.Vector3D.create
+
+# (root component id, multiplier) -> (bbox min, bbox max, bounds dict); the bbox check invalidates on geometry edits
+_bounds_cache = {}
+_BOUNDS_CACHE_MAX = 8
+
+# =========================
+# SCALAR KERNELS
+# =========================
+# Pure float in, float tuple out: no Fusion objects, so they can be JIT compiled.
+
+@_kernel
+def _up_kernel(ux, uy, uz, vx, vy, vz):
+    # Project up onto view and subtract to get the perpendicular component
+    d = ux * vx + uy * vy + uz * vz
+    ox, oy, oz = ux - d * vx, uy - d * vy, uz - d * vz
+    # Normalize to unit vector (left as-is when degenerate, like Vector3D.normalize)
+    length = sqrt(ox * ox + oy * oy + oz * oz)
+    if length > 0.0:
+        inv = 1.0 / length
+        return ox * inv, oy * inv, oz * inv
+    return ox, oy, oz
+
+@_kernel
+def _horizontal_length_kernel(vx, vy, vz, ux, uy, uz):
+    # Remove the component of v along up (up need not be unit length)
+    up_len_sq = ux * ux + uy * uy + uz * uz
+    if up_len_sq > 0.0:
+        d = (vx * ux + vy * uy + vz * uz) / up_len_sq
+        vx, vy, vz = vx - d * ux, vy - d * uy, vz - d * uz
+    return sqrt(vx * vx + vy * vy + vz * vz)
+
+@_kernel
+def _dolly_kernel(ex, ey, ez, tx, ty, tz, horizontal_distance, min_distance):
+    # Horizontal (XZ) direction, radius solve and inclination preserve in one pass
+    dx = tx - ex
+    dz = tz - ez
+    horiz_len = hypot(dx, dz)
+    # If horizontal length is too small, use default direction
+    if horiz_len < min_distance:
+        dx, dz, horiz_len = 1.0, 0.0, 1.0
+    inv_h = 1.0 / horiz_len
+    # Preserve inclination: tan(atan2(dy, h)) * H reduces to dy * H / h
+    new_dy = (ty - ey) * horizontal_distance * inv_h
+    return (tx - dx * inv_h * horizontal_distance, ey, tz - dz * inv_h * horizontal_distance,
+            tx, ey + new_dy, tz)
+
+@_kernel
+def _pan_kernel(ex, ez, tx, tz, pan_angle_deg):
+    # Fixed XZ radius; a degenerate radius falls back to unit length
+    radius = hypot(tx - ex, tz - ez)
+    if radius < 1e-6:
+        radius = 1.0
+    # The +180 degree offset is folded into the signs: sin(a + pi) = -sin(a), cos(a + pi) = -cos(a)
+    pan_angle_rad = radians(pan_angle_deg)
+    return ex - sin(pan_angle_rad) * radius, ez - cos(pan_angle_rad) * radius
+
+@_kernel
+def _tilt_kernel(ex, ey, ez, tx, ty, tz, tilt_angle_deg):
+    # Keep azimuth and eye-target distance, replace the vertical angle
+    dx, dy, dz = tx - ex, ty - ey, tz - ez
+    azimuth_rad = atan2(dx, dz)  # atan2 needs no normalization
+    distance = sqrt(dx * dx + dy * dy + dz * dz)
+    tilt_rad = radians(tilt_angle_deg)
+    horizontal = cos(tilt_rad) * distance
+    return (ex + horizontal * sin(azimuth_rad),
+            ey + sin(tilt_rad) * distance,
+            ez + horizontal * cos(azimuth_rad))
+
+@_kernel
+def point_at_level(px, py, pz, ux, uy, uz, level):
+    # Move p along unit up so that dot(p, up) == level: p + (level - dot(p, up)) * up
+    delta = level - (px * ux + py * uy + pz * uz)
+    return px + ux * delta, py + uy * delta, pz + uz * delta
+
+@_kernel
+def _view_angles_kernel(cx, cy, cz):
+    # Azimuth/inclination in degrees for a canonical view direction (need not be unit length)
+    length = sqrt(cx * cx + cy * cy + cz * cz)
+    if length == 0.0:
+        return -180.0, 0.0  # Zero vector: same as atan2(0, 0) and asin(0) on the normalized vector
+    azimuth = (degrees(atan2(cx, cz)) + 360.0) % 360.0 - 180.0
+    inclination = -degrees(asin(max(-1.0, min(1.0, cy / length))))
+    return azimuth, inclination
+
+@_kernel
+def _eye_from_angles_kernel(tx, ty, tz, azimuth_deg, inclination_deg, distance,
+                            m0, m1, m2, m4, m5, m6, m8, m9, m10):
+    # Clamp inclination to avoid gimbal lock
+    inclination_deg = max(min(inclination_deg, 89.999), -89.999)
+    az = radians(azimuth_deg)
+    inc = radians(inclination_deg)
+    # Spherical to Cartesian direction in canonical space
+    cos_inc = cos(inc)
+    dx = cos_inc * sin(az)  # X component
+    dy = sin(inc)           # Y component (vertical)
+    dz = cos_inc * cos(az)  # Z component
+    # Rotate to document space (3x3 part of the from_canonical matrix) and offset from the target
+    return (tx + (m0 * dx + m1 * dy + m2 * dz) * distance,
+            ty + (m4 * dx + m5 * dy + m6 * dz) * distance,
+            tz + (m8 * dx + m9 * dy + m10 * dz) * distance)
+
+# =========================
+# CANONICAL FRAME
+# =========================
+
+def _canonical_eye_target(camera, app):
+    """
+    Returns (eye_canon, target_canon, from_canonical) for the camera.
+    For Y-up documents the transforms are the identity, so the camera points are used as-is
+    and from_canonical is None.
+    """
+    design = app.activeProduct if app else None
+    doc_up, to_canonical, from_canonical = camera_transforms.get_canonical_frame(design, adsk)
+    if camera_transforms.is_canonical_up(doc_up):
+        return camera.eye, camera.target, None
+    eye_canon = camera_transforms.transform_point(camera.eye, to_canonical, adsk)
+    target_canon = camera_transforms.transform_point(camera.target, to_canonical, adsk)
+    return eye_canon, target_canon, from_canonical
+
+def _from_canonical(point, from_canonical):
+    """
+    Transform a canonical point back to document space (no-op for Y-up documents).
+    """
+    if from_canonical is None:
+        return point
+    return camera_transforms.transform_point(point, from_canonical, adsk)
+
 # =========================
 # BASIC CAMERA MATH
 # =========================
 
 def get_distance_from_camera(camera):
     """Returns the Euclidean distance from the camera eye to the camera target."""
-    # Simple 3D distance calculation
-    return camera.eye.distanceTo(camera.target)
+    # Scalar 3D distance on the coordinates; avoids a distanceTo round-trip into Fusion
+    ex, ey, ez = camera.eye.asArray()
+    tx, ty, tz = camera.target.asArray()
+    return sqrt((tx - ex) ** 2 + (ty - ey) ** 2 + (tz - ez) ** 2)
+
+def _canonical_view_direction(camera, to_canonical):
+    """Unnormalized eye -> target direction in canonical space, as floats."""
+    ex, ey, ez = camera.eye.asArray()
+    tx, ty, tz = camera.target.asArray()
+    return camera_transforms.rotate_xyz(camera_transforms.get_matrix_array(to_canonical), tx - ex, ty - ey, tz - ez)
 
-def get_azimuth(camera, transform_vector_func):
+def get_azimuth(camera, to_canonical):
     """
     Calculate azimuth (horizontal angle) in canonical space.
     Azimuth is the angle in the XZ plane from the canonical +Z axis, CCW positive.
+    to_canonical is the document -> canonical Matrix3D.
     """
-    # Get vector from eye to target
-    v = camera.eye.vectorTo(camera.target)
-    v.normalize()
-    # Transform to canonical space
-    v = transform_vector_func(v)
-    # Calculate angle in XZ plane
-    azimuth = math.degrees(math.atan2(v.x, v.z))
-    # Normalize to [-180, 180]
-    azimuth = (azimuth + 360) % 360 - 180
-    return round(azimuth, 2)
+    # Eye -> target in canonical space, rotated on floats (atan2 needs no normalization)
+    cx, cy, cz = _canonical_view_direction(camera, to_canonical)
+    # Angle in XZ plane, normalized to [-180, 180]
+    return round(_view_angles_kernel(cx, cy, cz)[0], 2)
 
-def get_inclination(camera, transform_vector_func):
+def get_inclination(camera, to_canonical):
     """
     Calculate inclination (vertical angle) in canonical space.
     Inclination is the angle above/below the canonical XZ plane.
-    """
-    # Get vector from eye to target
-    v = camera.eye.vectorTo(camera.target)
-    v.normalize()
-    # Transform to canonical space
-    v = transform_vector_func(v)
-    # Calculate vertical angle (asin of Y component)
-    return -round(math.degrees(math.asin(v.y)), 2)
+    to_canonical is the document -> canonical Matrix3D.
+    """
+    # Eye -> target in canonical space, rotated on floats
+    cx, cy, cz = _canonical_view_direction(camera, to_canonical)
+    # Vertical angle (asin of the normalized Y component)
+    return round(_view_angles_kernel(cx, cy, cz)[1], 2)
+
+def get_canonical_camera_state(camera, to_canonical, doc_up):
+    """
+    Derive every telemetry quantity from one read of eye/target/upVector.
+    Same results as get_azimuth/get_inclination/get_dolly/get_pan/get_tilt and eye_level_utils.get_eye_level,
+    but the canonical rotation is done inline on floats instead of once per getter through Fusion objects.
+    Returns a dict of plain floats and (x, y, z) tuples.
+    """
+    ex, ey, ez = camera.eye.asArray()
+    tx, ty, tz = camera.target.asArray()
+    ux, uy, uz = camera.upVector.asArray()
+    dux, duy, duz = doc_up.x, doc_up.y, doc_up.z
+    m = camera_transforms.get_matrix_array(to_canonical)
+    rotate_xyz = camera_transforms.rotate_xyz
+
+    eye_c = rotate_xyz(m, ex, ey, ez)
+    target_c = rotate_xyz(m, tx, ty, tz)
+    # Points also pick up the matrix translation (zero for the pure rotations used here)
+    eye_c = (eye_c[0] + m[3], eye_c[1] + m[7], eye_c[2] + m[11])
+    target_c = (target_c[0] + m[3], target_c[1] + m[7], target_c[2] + m[11])
+    fx, fy, fz = tx - ex, ty - ey, tz - ez
+    azimuth, inclination = _view_angles_kernel(*rotate_xyz(m, fx, fy, fz))
+    azimuth = round(azimuth, 2)
+    inclination = round(inclination, 2)
+    return {
+        'eye': (ex, ey, ez),
+        'target': (tx, ty, tz),
+        'upVector': (ux, uy, uz),
+        'eye_canonical': eye_c,
+        'target_canonical': target_c,
+        'upVector_canonical': rotate_xyz(m, ux, uy, uz),
+        'eyeLevel': ex * dux + ey * duy + ez * duz,
+        'azimuth': azimuth,
+        'inclination': inclination,
+        'distance': sqrt(fx * fx + fy * fy + fz * fz),
+        'dolly': _horizontal_length_kernel(fx, fy, fz, dux, duy, duz),
+        'pan': azimuth,
+        'tilt': inclination,
+    }
 
 # =========================
 # CAMERA POSITION SETTERS
@@ -76,8 +253,7 @@ def set_camera_eye_to_point(app, point):
 
     # Get document up direction and normalize
     design = app.activeProduct if app else None
-    doc_up = camera_transforms.derive_document_up(design)
-    doc_up.normalize()
+    doc_up = camera_transforms.get_document_up(design)  # Already normalized; shared, so not normalized in place
 
     # Calculate new view vector and up vector
     view_vec = camera.eye.vectorTo(camera.target)
@@ -104,8 +280,7 @@ def set_camera_target_to_point(app, point):
 
     # Get document up direction and normalize
     design = app.activeProduct if app else None
-    doc_up = camera_transforms.derive_document_up(design)
-    doc_up.normalize()
+    doc_up = camera_transforms.get_document_up(design)  # Already normalized; shared, so not normalized in place
 
     # Calculate new view vector and up vector
     view_vec = camera.eye.vectorTo(camera.target)
@@ -121,16 +296,8 @@ def corrected_up_vector(view_vec, doc_up):
     Uses Gram-Schmidt orthogonalization to project doc_up onto the plane perpendicular to view_vec.
     This ensures the camera horizon remains level after eye/target moves.
     """
-    # Copy doc_up for manipulation
-    up_vec = doc_up.copy()
-    # Project doc_up onto view_vec
-    proj = view_vec.copy()
-    proj.scaleBy(up_vec.dotProduct(view_vec))
-    # Subtract projection to get perpendicular component
-    up_vec.subtract(proj)
-    # Normalize to unit vector
-    up_vec.normalize()
-    return up_vec
+    # Plain float math; only the result crosses back into the Fusion API
+    return _create_vector(*_up_kernel(doc_up.x, doc_up.y, doc_up.z, view_vec.x, view_vec.y, view_vec.z))
 
 # =========================
 # DOLLY (HORIZONTAL DISTANCE)
@@ -141,35 +308,17 @@ def get_dolly(camera, doc_up):
     Returns the horizontal distance from eye to target, projected onto the plane perpendicular to doc_up.
     This is the "dolly" distance, ignoring vertical displacement.
     """
-    # Get vector from eye to target
-    v = camera.eye.vectorTo(camera.target)
-    up = doc_up.copy()
-    up.normalize()
-    # Project v onto up direction
-    up_component = up.copy()
-    up_component.scaleBy(v.dotProduct(up))
-    # Subtract up component to get horizontal component
-    v_proj = v.copy()
-    v_proj.subtract(up_component)
-    # Return length of horizontal component
-    return v_proj.length
+    return get_dolly_from_points(camera.eye, camera.target, doc_up)
 
 def get_dolly_from_points(eye, target, doc_up):
     """
     Returns the horizontal distance from eye to target, projected onto the plane perpendicular to doc_up.
     """
-    # Get vector from eye to target
-    v = eye.vectorTo(target)
-    up = doc_up.copy()
-    up.normalize()
-    # Project v onto up direction
-    up_component = up.copy()
-    up_component.scaleBy(v.dotProduct(up))
-    # Subtract up component to get horizontal component
-    v_proj = v.copy()
-    v_proj.subtract(up_component)
-    # Return length of horizontal component
-    return v_proj.length
+    # Project the eye -> target vector onto the horizontal plane and return its length
+    return _horizontal_length_kernel(
+        target.x - eye.x, target.y - eye.y, target.z - eye.z,
+        doc_up.x, doc_up.y, doc_up.z
+    )
 
 def set_dolly(camera, horizontal_distance, min_distance=1e-6, app=None):
     """
@@ -178,46 +327,21 @@ def set_dolly(camera, horizontal_distance, min_distance=1e-6, app=None):
     Returns new eye and target points.
     """
     try:
-        # Get canonical transforms for document up
-        design = app.activeProduct if app else None
-        doc_up = camera_transforms.derive_document_up(design)
-        to_canonical = camera_transforms.get_to_canonical_matrix(doc_up, adsk)
-        from_canonical = camera_transforms.get_from_canonical_matrix(doc_up, adsk)
-
-        # Transform eye and target to canonical space
-        eye_canon = camera_transforms.transform_point(camera.eye, to_canonical, adsk)
-        target_canon = camera_transforms.transform_point(camera.target, to_canonical, adsk)
-
-        # Compute vector from eye to target in canonical space
-        v = eye_canon.vectorTo(target_canon)
-        v_len = v.length
-
-        # Project onto XZ plane (horizontal)
-        horiz = adsk.core.Vector3D.create(v.x, 0, v.z)
-        horiz_len = horiz.length
-        # If horizontal length is too small, use default direction
-        if horiz_len < min_distance:
-            horiz = adsk.core.Vector3D.create(1, 0, 0)
-            horiz_len = 1.0
-        horiz.normalize()
-
-        # Move eye horizontally to achieve desired dolly distance
-        new_eye_x = target_canon.x - horiz.x * horizontal_distance
-        new_eye_z = target_canon.z - horiz.z * horizontal_distance
-        new_eye_y = eye_canon.y  # Preserve Y
-
-        new_eye_canon = adsk.core.Point3D.create(new_eye_x, new_eye_y, new_eye_z)
-
-        # Preserve inclination (vertical/horizontal ratio)
-        dy = target_canon.y - eye_canon.y
-        inclination = math.atan2(dy, horiz_len)
-        new_dy = math.tan(inclination) * horizontal_distance
-        new_target_y = new_eye_y + new_dy
-        new_target_canon = adsk.core.Point3D.create(target_canon.x, new_target_y, target_canon.z)
+        # Eye and target in canonical space (skips the transforms for Y-up documents)
+        eye_canon, target_canon, from_canonical = _canonical_eye_target(camera, app)
+
+        # Move eye horizontally to achieve desired dolly distance, preserving Y and inclination
+        ex, ey, ez, tx, ty, tz = _dolly_kernel(
+            eye_canon.x, eye_canon.y, eye_canon.z,
+            target_canon.x, target_canon.y, target_canon.z,
+            horizontal_distance, min_distance
+        )
+        new_eye_canon = _create_point(ex, ey, ez)
+        new_target_canon = _create_point(tx, ty, tz)
 
         # Transform back to document space
-        new_eye = camera_transforms.transform_point(new_eye_canon, from_canonical, adsk)
-        new_target = camera_transforms.transform_point(new_target_canon, from_canonical, adsk)
+        new_eye = _from_canonical(new_eye_canon, from_canonical)
+        new_target = _from_canonical(new_target_canon, from_canonical)
 
         return new_eye, new_target
 
@@ -230,9 +354,9 @@ def set_dolly(camera, horizontal_distance, min_distance=1e-6, app=None):
 # PAN (HORIZONTAL ROTATION)
 # =========================
 
-def get_pan(camera, transform_vector_func):
+def get_pan(camera, to_canonical):
     """Returns the azimuth angle (horizontal rotation) in canonical space."""
-    return get_azimuth(camera, transform_vector_func)
+    return get_azimuth(camera, to_canonical)
 
 def set_pan(camera, pan_angle_deg, app=None):
     """
@@ -242,43 +366,23 @@ def set_pan(camera, pan_angle_deg, app=None):
     Returns new eye and target points.
     """
     try:
-        # Get canonical transforms for document up
-        design = app.activeProduct if app else None
-        doc_up = camera_transforms.derive_document_up(design)
-        to_canonical = camera_transforms.get_to_canonical_matrix(doc_up, adsk)
-        from_canonical = camera_transforms.get_from_canonical_matrix(doc_up, adsk)
-
-        # Transform eye and target to canonical space
-        eye_canon = camera_transforms.transform_point(camera.eye, to_canonical, adsk)
-        target_canon = camera_transforms.transform_point(camera.target, to_canonical, adsk)
-
-        # Compute vector from eye to target in canonical space
-        v = eye_canon.vectorTo(target_canon)
-        horiz_x = v.x
-        horiz_z = v.z
-        radius = math.hypot(horiz_x, horiz_z)  # Distance in XZ plane
-
-        # If radius is too small, use default direction
-        min_distance = 1e-6
-        if radius < min_distance:
-            radius = 1.0
-            horiz_x = 1.0
-            horiz_z = 0.0
-
-        # Calculate new target position with fixed radius and pan angle
-        pan_angle_rad = math.radians(pan_angle_deg + 180)
-        new_target_x = eye_canon.x + math.sin(pan_angle_rad) * radius
-        new_target_z = eye_canon.z + math.cos(pan_angle_rad) * radius
+        # Eye and target in canonical space (skips the transforms for Y-up documents)
+        eye_canon, target_canon, from_canonical = _canonical_eye_target(camera, app)
+
+        # Calculate new target position with fixed XZ radius and pan angle
+        new_target_x, new_target_z = _pan_kernel(
+            eye_canon.x, eye_canon.z, target_canon.x, target_canon.z, pan_angle_deg
+        )
 
         # Target's Y (height) is preserved
-        new_target_canon = adsk.core.Point3D.create(
+        new_target_canon = _create_point(
             new_target_x,
             target_canon.y,
             new_target_z
         )
 
         # Transform new target back to document space
-        new_target = camera_transforms.transform_point(new_target_canon, from_canonical, adsk)
+        new_target = _from_canonical(new_target_canon, from_canonical)
         new_eye = camera.eye  # eye does not move
 
         return new_eye, new_target
@@ -292,9 +396,9 @@ def set_pan(camera, pan_angle_deg, app=None):
 # TILT (VERTICAL ROTATION)
 # =========================
 
-def get_tilt(camera, transform_vector_func):
+def get_tilt(camera, to_canonical):
     """Returns the inclination angle (vertical rotation) in canonical space."""
-    return get_inclination(camera, transform_vector_func)
+    return get_inclination(camera, to_canonical)
 
 def set_tilt(camera, tilt_angle_deg, app=None):
     """
@@ -307,42 +411,18 @@ def set_tilt(camera, tilt_angle_deg, app=None):
         # Clamp tilt to avoid gimbal lock
         tilt_angle_deg = max(min(tilt_angle_deg, 89.999), -89.999)
 
-        # Get canonical transforms for document up
-        design = app.activeProduct if app else None
-        doc_up = camera_transforms.derive_document_up(design)
-        to_canonical = camera_transforms.get_to_canonical_matrix(doc_up, adsk)
-        from_canonical = camera_transforms.get_from_canonical_matrix(doc_up, adsk)
-
-        # Transform eye and target to canonical space
-        eye_canon = camera_transforms.transform_point(camera.eye, to_canonical, adsk)
-        target_canon = camera_transforms.transform_point(camera.target, to_canonical, adsk)
-
-        # Calculate current azimuth in canonical space
-        v = eye_canon.vectorTo(target_canon)
-        v.normalize()
-        azimuth = math.degrees(math.atan2(v.x, v.z))
-
-        # Use the same distance between eye and target
-        distance = eye_canon.distanceTo(target_canon)
-
-        # Calculate new target position with fixed azimuth and new tilt (in canonical)
-        tilt_rad = math.radians(tilt_angle_deg)
-        azimuth_rad = math.radians(azimuth)
-        # Spherical to Cartesian conversion for new direction vector
-        new_v = adsk.core.Vector3D.create(
-            math.cos(tilt_rad) * math.sin(azimuth_rad),  # X component
-            math.sin(tilt_rad),                          # Y component (vertical)
-            math.cos(tilt_rad) * math.cos(azimuth_rad)   # Z component
-        )
-        # Scale direction vector by distance and add to eye position
-        new_target_canon = adsk.core.Point3D.create(
-            eye_canon.x + new_v.x * distance,
-            eye_canon.y + new_v.y * distance,
-            eye_canon.z + new_v.z * distance
-        )
+        # Eye and target in canonical space (skips the transforms for Y-up documents)
+        eye_canon, target_canon, from_canonical = _canonical_eye_target(camera, app)
+
+        # Calculate new target position with fixed azimuth and distance, and new tilt (in canonical)
+        new_target_canon = _create_point(*_tilt_kernel(
+            eye_canon.x, eye_canon.y, eye_canon.z,
+            target_canon.x, target_canon.y, target_canon.z,
+            tilt_angle_deg
+        ))
 
         # Transform new target back to document space
-        new_target = camera_transforms.transform_point(new_target_canon, from_canonical, adsk)
+        new_target = _from_canonical(new_target_canon, from_canonical)
         new_eye = camera.eye  # eye does not move
 
         return new_eye, new_target
@@ -361,69 +441,29 @@ def apply_eye_level(new_eye, up_vec, eye_level):
     Moves the eye point along the up vector to achieve the specified eye_level.
     Returns a new Point3D.
     """
-    # Convert eye point to vector
-    eye_vec = new_eye.asVector()
-    # Project onto up vector to get current level
-    current_eye_level = eye_vec.dotProduct(up_vec)
-    # Calculate offset needed to reach desired level
-    delta = eye_level - current_eye_level
-    up_offset = up_vec.copy()
-    up_offset.scaleBy(delta)
-    # Apply offset to eye vector
-    eye_vec = adsk.core.Vector3D.create(
-        eye_vec.x + up_offset.x,
-        eye_vec.y + up_offset.y,
-        eye_vec.z + up_offset.z
-    )
-    # Convert back to point
-    return adsk.core.Point3D.create(eye_vec.x, eye_vec.y, eye_vec.z)
+    # Scalar kernel on the components, with a single Point3D allocation
+    return _create_point(*point_at_level(new_eye.x, new_eye.y, new_eye.z, up_vec.x, up_vec.y, up_vec.z, eye_level))
 
 def apply_target_level(target, up_vec, target_level):
     """
     Moves the target point along the up vector to achieve the specified target_level.
     Returns a new Point3D.
     """
-    # Convert target point to vector
-    target_vec = target.asVector()
-    # Project onto up vector to get current level
-    current_target_level = target_vec.dotProduct(up_vec)
-    # Calculate offset needed to reach desired level
-    delta = target_level - current_target_level
-    up_offset = up_vec.copy()
-    up_offset.scaleBy(delta)
-    # Apply offset to target vector
-    target_vec = adsk.core.Vector3D.create(
-        target_vec.x + up_offset.x,
-        target_vec.y + up_offset.y,
-        target_vec.z + up_offset.z
-    )
-    # Convert back to point
-    return adsk.core.Point3D.create(target_vec.x, target_vec.y, target_vec.z)
+    # Scalar kernel on the components, with a single Point3D allocation
+    return _create_point(*point_at_level(target.x, target.y, target.z, up_vec.x, up_vec.y, up_vec.z, target_level))
 
 def new_eye_from_angles(target, azimuth, inclination, distance, from_canonical, adsk):
     """
     Calculate new eye position given target, azimuth, inclination, and distance.
     Converts spherical coordinates to Cartesian, then transforms from canonical space.
+    from_canonical is the canonical -> document Matrix3D.
     """
-    # Clamp inclination to avoid gimbal lock
-    inclination = max(min(inclination, 89.999), -89.999)
-    # Convert angles to radians
-    az = math.radians(azimuth)
-    inc = math.radians(inclination)
-    # Spherical to Cartesian conversion for direction vector
-    dir_vec = adsk.core.Vector3D.create(
-        math.cos(inc) * math.sin(az),  # X component
-        math.sin(inc),                 # Y component (vertical)
-        math.cos(inc) * math.cos(az)   # Z component
-    )
-    # Transform direction vector from canonical to document space
-    dir_vec = from_canonical(dir_vec)
-    # Calculate new eye position by offsetting from target
-    return adsk.core.Point3D.create(
-        target.x + dir_vec.x * distance,
-        target.y + dir_vec.y * distance,
-        target.z + dir_vec.z * distance
-    )
+    m = camera_transforms.get_matrix_array(from_canonical)
+    tx, ty, tz = target.asArray()
+    return _create_point(*_eye_from_angles_kernel(
+        tx, ty, tz, float(azimuth), float(inclination), float(distance),
+        m[0], m[1], m[2], m[4], m[5], m[6], m[8], m[9], m[10]
+    ))
 
 # =========================
 # FOV/FOCAL LENGTH CONVERSIONS
@@ -435,7 +475,7 @@ def fov_to_focal_length(fov_deg, sensor_width=36.0):
     Uses standard lens formula for 35mm photography.
     """
     # f = sensor_width / (2 * tan(FOV/2))
-    return sensor_width / (2 * math.tan(math.radians(fov_deg) / 2))
+    return sensor_width / (2 * tan(radians(fov_deg) / 2))
 
 def focal_length_to_fov(focal_length, sensor_width=36.0):
     """
@@ -443,7 +483,7 @@ def focal_length_to_fov(focal_length, sensor_width=36.0):
     Uses standard lens formula for 35mm photography.
     """
     # FOV = 2 * atan(sensor_width / (2 * f))
-    return math.degrees(2 * math.atan(sensor_width / (2 * focal_length)))
+    return degrees(2 * atan(sensor_width / (2 * focal_length)))
 
 # =========================
 # DISTANCE BOUNDS
@@ -453,24 +493,36 @@ def distance_bounds_from_design(design, distance_multiplier=4.0, app=None):
     """
     Return min/max camera distance based on root component bounding box.
     Uses model diagonal as a reference for reasonable camera distances.
+    Results are memoized per (root component, multiplier) and reused while the bounding box is unchanged.
     """
     try:
         if isinstance(design, adsk.fusion.Design):
             root_comp = design.rootComponent
             bounding_box = root_comp.boundingBox
+            min_pt = tuple(bounding_box.minPoint.asArray())
+            max_pt = tuple(bounding_box.maxPoint.asArray())
+            key = (root_comp.id, distance_multiplier)
+            cached = _bounds_cache.get(key)
+            if cached is not None and cached[0] == min_pt and cached[1] == max_pt:
+                return dict(cached[2])
             # Calculate diagonal length of bounding box
-            diag = bounding_box.maxPoint.distanceTo(bounding_box.minPoint)
+            (nx, ny, nz), (mx, my, mz) = min_pt, max_pt
+            diag = sqrt((mx - nx) ** 2 + (my - ny) ** 2 + (mz - nz) ** 2)
             # Use diagonal to set min/max camera distance
             min_distance = max(diag / distance_multiplier, 1.0)
             max_distance = diag * distance_multiplier
             if app:
-                log_utils.log(app, f'📏 Model diagonal: {diag:.1f}cm, distance range: {min_distance:.1f} - {max_distance:.1f}cm', level='INFO', module=LOG_MODULE)
-            return {
+                log_utils.log(app, '📏 Model diagonal: %.1fcm, distance range: %.1f - %.1fcm', diag, min_distance, max_distance, level='INFO', module=LOG_MODULE)
+            result = {
                 'min_distance': min_distance,
                 'max_distance': max_distance,
                 'diagonal_length': diag,
                 'distance_multiplier': distance_multiplier
             }
+            if len(_bounds_cache) >= _BOUNDS_CACHE_MAX:
+                _bounds_cache.clear()
+            _bounds_cache[key] = (min_pt, max_pt, result)
+            return dict(result)
         else:
             if app:
                 log_utils.log(app, '📏 No design context - using default distance range: 10 - 10000cm', level='INFO', module=LOG_MODULE)
@@ -11,17 +11,92 @@ To avoid these issues, we use multi-step assignments and explicit value restorat
 
 import adsk
 import math
-import time
 import traceback
 
 LOG_MODULE = 'camera_commands'
 
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)  # Set True for debugging
-from ..utilities import camera_calculations, camera_transforms
+from ..utilities import camera_calculations, camera_transforms, eye_level_utils
+
+# Pre-bound constructors (no per-call attribute lookups on the slider path)
+_create_point = adsk.core.Point3D.create
+_create_vector = adsk.core.Vector3D.create
 
 # --- PAYLOAD BUILDERS ---
 
+def _point3d_from(value):
+    """Create a Point3D from an {'x','y','z'} dict or an (x, y, z) sequence."""
+    if isinstance(value, dict):
+        return _create_point(value['x'], value['y'], value['z'])
+    return _create_point(*value)
+
+def _vector3d_from(value):
+    """Create a Vector3D from an {'x','y','z'} dict or an (x, y, z) sequence."""
+    if isinstance(value, dict):
+        return _create_vector(value['x'], value['y'], value['z'])
+    return _create_vector(*value)
+
+def _as_point3d(value):
+    """Pass a Point3D through; build one from a dict or sequence otherwise."""
+    return value if isinstance(value, adsk.core.Point3D) else _point3d_from(value)
+
+def _as_vector3d(value):
+    """Pass a Vector3D through; build one from a dict or sequence otherwise."""
+    return value if isinstance(value, adsk.core.Vector3D) else _vector3d_from(value)
+
+def _xyz(value):
+    """(x, y, z) from an {'x','y','z'} dict, an (x, y, z) sequence, or a Point3D/Vector3D."""
+    if isinstance(value, dict):
+        return value['x'], value['y'], value['z']
+    if hasattr(value, 'asArray'):
+        return value.asArray()
+    return value
+
+def _camera_signature(eye, target, up, perspective_angle, camera_type, view_extents, is_fit_view):
+    """
+    Rounded (eye, target, up, fov, view extents, type, fit) tuple used to detect camera assignments that change nothing.
+    View extents are included because orthographic zoom changes them without moving eye or target.
+    """
+    return (
+        tuple(round(v, 6) for v in (*_xyz(eye), *_xyz(target), *_xyz(up), perspective_angle, view_extents)),
+        int(camera_type),
+        bool(is_fit_view)
+    )
+
+def _signature_of(camera):
+    """Signature of a Fusion camera's current state."""
+    return _camera_signature(camera.eye, camera.target, camera.upVector, camera.perspectiveAngle,
+                             camera.cameraType, camera.viewExtents, camera.isFitView)
+
+def _payload_matches_camera(payload, camera):
+    """True when applying the payload would leave the camera unchanged (missing keys keep current values)."""
+    try:
+        camera_type = payload.get('cameraType', camera.cameraType)
+        if int(camera_type) == adsk.core.CameraTypes.OrthographicCameraType and 'viewExtents' not in payload:
+            return False  # Ortho framing lives in viewExtents; without them the apply (and its fit) must run
+        current = _signature_of(camera)
+        incoming = _camera_signature(
+            payload.get('eye', camera.eye),
+            payload.get('target', camera.target),
+            payload.get('upVector', camera.upVector),
+            float(payload.get('perspectiveAngle', camera.perspectiveAngle)),
+            camera_type,
+            float(payload['viewExtents']) if 'viewExtents' in payload else camera.viewExtents,
+            payload.get('isFitView', camera.isFitView)
+        )
+        return current == incoming
+    except Exception:
+        return False  # Unrecognized payload shape: apply as usual
+
+def _lens_changing(camera_type, perspective_angle, current_type, current_angle):
+    """True when the camera type or FOV differs, i.e. when Fusion may reframe and the two-step apply is needed."""
+    return int(camera_type) != int(current_type) or abs(float(perspective_angle) - current_angle) >= 1e-6
+
+# Pending keys that move the eye along the orbit sphere, and keys whose set_* functions replace eye and target outright
+_SPHERICAL_KEYS = frozenset(('azimuth', 'inclination', 'distance'))
+_ABSOLUTE_MOVE_KEYS = frozenset(('dolly', 'pan', 'tilt'))
+
 def build_camera_payload(pending_update, app):
     """
     Builds a camera payload from pending updates and current camera state.
@@ -29,7 +104,7 @@ def build_camera_payload(pending_update, app):
     suitable for direct application to the Fusion camera.
 
     NOTE: If explicit eye/target/upVector are present in pending_update (e.g. for eye lock + FOV change),
-    those are used directly. Otherwise, spherical math is used to calculate new positions.
+    those are used directly. They may be dicts or (x, y, z) sequences from asArray(). Otherwise, spherical math is used to calculate new positions.
     """
     viewport = app.activeViewport
     camera = viewport.camera
@@ -39,39 +114,51 @@ def build_camera_payload(pending_update, app):
         return None
 
     # Get canonical transforms for document up
-    doc_up = camera_transforms.derive_document_up(design)
-    to_canonical = camera_transforms.get_to_canonical_matrix(doc_up, adsk)
-    from_canonical = camera_transforms.get_from_canonical_matrix(doc_up, adsk)
+    doc_up, to_canonical, from_canonical = camera_transforms.get_canonical_frame(design, adsk)
     target = camera.target
 
     # --- Extract or calculate all camera properties ---
-    azimuth = pending_update.get('azimuth', camera_calculations.get_azimuth(camera, lambda v: camera_transforms.transform_vector(v, to_canonical, adsk)))
-    inclination = pending_update.get('inclination', camera_calculations.get_inclination(camera, lambda v: camera_transforms.transform_vector(v, to_canonical, adsk)))
-    distance = pending_update.get('distance', camera_calculations.get_distance_from_camera(camera))
-    fov = pending_update.get('fov', math.degrees(camera.perspectiveAngle))
-    camera_type = pending_update.get('cameraType', camera.cameraType)
+    # Current values are only read from the camera when the update does not supply them
+    fov = pending_update.get('fov')
+    if fov is None:
+        fov = math.degrees(camera.perspectiveAngle)
+    camera_type = pending_update.get('cameraType')
+    if camera_type is None:
+        camera_type = camera.cameraType
 
     # --- Calculate new eye position from spherical angles ---
     # If explicit eye/target/upVector are present, use them (for eye lock scenarios)
     if 'eye' in pending_update:
-        new_eye = adsk.core.Point3D.create(**pending_update['eye'])
+        new_eye = _point3d_from(pending_update['eye'])
     else:
-        new_eye = camera_calculations.new_eye_from_angles(
-            target, azimuth, inclination, distance,
-            lambda v: camera_transforms.transform_vector(v, from_canonical, adsk), adsk
-        )
+        if pending_update.keys() & _SPHERICAL_KEYS and not pending_update.keys() & _ABSOLUTE_MOVE_KEYS:
+            azimuth = pending_update.get('azimuth')
+            if azimuth is None:
+                azimuth = camera_calculations.get_azimuth(camera, to_canonical)
+            inclination = pending_update.get('inclination')
+            if inclination is None:
+                inclination = camera_calculations.get_inclination(camera, to_canonical)
+            distance = pending_update.get('distance')
+            if distance is None:
+                distance = camera_calculations.get_distance_from_camera(camera)
+            new_eye = camera_calculations.new_eye_from_angles(
+                target, azimuth, inclination, distance, from_canonical, adsk
+            )
+        else:
+            # FOV/type/level-only updates, or dolly/pan/tilt (which replace the eye below): keep the current eye
+            new_eye = camera.eye
         if 'eyeLevel' in pending_update:
             new_eye = camera_calculations.apply_eye_level(new_eye, doc_up, pending_update['eyeLevel'])
 
     if 'target' in pending_update:
-        new_target = adsk.core.Point3D.create(**pending_update['target'])
+        new_target = _point3d_from(pending_update['target'])
     else:
         new_target = target
         if 'targetLevel' in pending_update:
             new_target = camera_calculations.apply_target_level(target, doc_up, pending_update['targetLevel'])
 
     if 'upVector' in pending_update:
-        up_vec = adsk.core.Vector3D.create(**pending_update['upVector'])
+        up_vec = _vector3d_from(pending_update['upVector'])
     else:
         up_vec = doc_up
 
@@ -85,10 +172,11 @@ def build_camera_payload(pending_update, app):
         new_eye, new_target = camera_calculations.set_tilt(camera, pending_update['tilt'], app=app)
 
     # --- Build the payload dict for Fusion camera assignment ---
+    # Internal only: the Point3D/Vector3D objects are passed through as-is, no per-axis dicts to unpack again
     payload = {
-        'eye': {'x': new_eye.x, 'y': new_eye.y, 'z': new_eye.z},
-        'target': {'x': new_target.x, 'y': new_target.y, 'z': new_target.z},
-        'upVector': {'x': up_vec.x, 'y': up_vec.y, 'z': up_vec.z},
+        'eye': new_eye,
+        'target': new_target,
+        'upVector': up_vec,
         'perspectiveAngle': math.radians(fov),
         'cameraType': camera_type,
         'isFitView': False,
@@ -106,14 +194,18 @@ def build_camera_payload_from_canonical(camera_data, app):
     if design is None:
         log_utils.log(app, "❌ No active design/product. Camera payload aborted.", level='ERROR', module=LOG_MODULE)
         return None
-    doc_up = camera_transforms.derive_document_up(design)
-    eye_doc = camera_transforms.from_canon_point(adsk.core.Point3D.create(**camera_data['eye']), doc_up, adsk)
-    target_doc = camera_transforms.from_canon_point(adsk.core.Point3D.create(**camera_data['target']), doc_up, adsk)
-    up_doc = camera_transforms.from_canon_vector(adsk.core.Vector3D.create(**camera_data['upVector']), doc_up, adsk)
+    _, _, from_canonical = camera_transforms.get_canonical_frame(design, adsk)
+    # Fresh objects from the camera data, so they can be transformed in place
+    eye_doc = _point3d_from(camera_data['eye'])
+    target_doc = _point3d_from(camera_data['target'])
+    up_doc = _vector3d_from(camera_data['upVector'])
+    eye_doc.transformBy(from_canonical)
+    target_doc.transformBy(from_canonical)
+    up_doc.transformBy(from_canonical)
     payload = {
-        'eye': {'x': eye_doc.x, 'y': eye_doc.y, 'z': eye_doc.z},
-        'target': {'x': target_doc.x, 'y': target_doc.y, 'z': target_doc.z},
-        'upVector': {'x': up_doc.x, 'y': up_doc.y, 'z': up_doc.z},
+        'eye': eye_doc,
+        'target': target_doc,
+        'upVector': up_doc,
         'perspectiveAngle': camera_data['perspectiveAngle'],
         'cameraType': camera_data['cameraType'],
         'isFitView': False,
@@ -141,6 +233,12 @@ def apply_camera_state(payload, app, apply_mode="direct"):
     viewport = app.activeViewport
     camera = viewport.camera
 
+    # Identical state (debounced slider repeats, echoed state): skip the assignments and the redraw
+    if _payload_matches_camera(payload, camera):
+        return
+    current_type = camera.cameraType
+    current_angle = camera.perspectiveAngle
+
     # If camera type is changing, sanitize first to avoid Fusion quirks
     # (Fusion can get "stuck" if switching between ortho/persp without clearing extents)
     if 'cameraType' in payload and payload['cameraType'] != camera.cameraType:
@@ -149,28 +247,24 @@ def apply_camera_state(payload, app, apply_mode="direct"):
             target_camera_type=payload['cameraType']
         )
 
-    def to_point3d(val):
-        return adsk.core.Point3D.create(**val) if isinstance(val, dict) else val
-
-    def to_vector3d(val):
-        return adsk.core.Vector3D.create(**val) if isinstance(val, dict) else val
-
     if apply_mode == "direct":
         # --- Two-step apply for Fusion quirks ---
-        # Step 1: Set FOV and camera type, then assign camera
-        # This avoids Fusion's auto-reframing when FOV/type changes
-        camera.perspectiveAngle = float(payload['perspectiveAngle'])
-        camera.cameraType = int(payload['cameraType'])
-        camera.isFitView = False
-        camera.isSmoothTransition = False
-        viewport.camera = camera
+        # Only needed when FOV or type changes; otherwise there is no reframing to undo and one assignment does
+        if _lens_changing(payload['cameraType'], payload['perspectiveAngle'], current_type, current_angle):
+            # Step 1: Set FOV and camera type, then assign camera
+            # This avoids Fusion's auto-reframing when FOV/type changes
+            camera.perspectiveAngle = float(payload['perspectiveAngle'])
+            camera.cameraType = int(payload['cameraType'])
+            camera.isFitView = False
+            camera.isSmoothTransition = False
+            viewport.camera = camera
+            camera = viewport.camera
 
         # Step 2: Set eye, target, upVector, then assign again
         # This restores the desired camera position after FOV/type change
-        camera = viewport.camera
-        camera.eye = to_point3d(payload['eye'])
-        camera.target = to_point3d(payload['target'])
-        camera.upVector = to_vector3d(payload['upVector'])
+        camera.eye = _as_point3d(payload['eye'])
+        camera.target = _as_point3d(payload['target'])
+        camera.upVector = _as_vector3d(payload['upVector'])
         camera.isFitView = False
         camera.isSmoothTransition = False
         viewport.camera = camera
@@ -185,14 +279,13 @@ def apply_camera_state(payload, app, apply_mode="direct"):
         # For most UI changes, a single assignment is sufficient.
         # However, for FOV/FL changes with eye lock, Fusion may reframe the camera.
         # To prevent this, we use a two-step assignment (similar to 'direct' mode).
-        from ..utilities import eye_level_utils
         eye_lock_active = eye_level_utils.is_eye_level_lock_active()
         fov_or_fl_changing = 'perspectiveAngle' in payload or 'fov' in payload or 'focalLength' in payload
         if eye_lock_active and fov_or_fl_changing:
             # Step 1: Set FOV and camera type
-            cached_eye = to_point3d(payload['eye']) if 'eye' in payload else camera.eye
-            cached_target = to_point3d(payload['target']) if 'target' in payload else camera.target
-            cached_up = to_vector3d(payload['upVector']) if 'upVector' in payload else camera.upVector
+            cached_eye = _as_point3d(payload['eye']) if 'eye' in payload else camera.eye
+            cached_target = _as_point3d(payload['target']) if 'target' in payload else camera.target
+            cached_up = _as_vector3d(payload['upVector']) if 'upVector' in payload else camera.upVector
 
             camera.perspectiveAngle = float(payload['perspectiveAngle'])
             camera.cameraType = int(payload['cameraType'])
@@ -223,11 +316,11 @@ def apply_camera_state(payload, app, apply_mode="direct"):
             if 'isSmoothTransition' in payload:
                 camera.isSmoothTransition = False
             if 'eye' in payload:
-                camera.eye = to_point3d(payload['eye'])
+                camera.eye = _as_point3d(payload['eye'])
             if 'target' in payload:
-                camera.target = to_point3d(payload['target'])
+                camera.target = _as_point3d(payload['target'])
             if 'upVector' in payload:
-                camera.upVector = to_vector3d(payload['upVector'])
+                camera.upVector = _as_vector3d(payload['upVector'])
             viewport.camera = camera
             viewport.refresh()
 
@@ -244,6 +337,10 @@ def apply_named_view_camera(named_view, app):
     current_camera = viewport.camera
     target_camera = named_view.camera
 
+    # Re-selecting the view the camera already shows: nothing to assign or redraw
+    if _signature_of(target_camera) == _signature_of(current_camera):
+        return
+
     # Sanitize if switching camera type
     if target_camera.cameraType != current_camera.cameraType:
         sanitize_camera_for_type_change(
@@ -253,17 +350,19 @@ def apply_named_view_camera(named_view, app):
             target_is_fit_view=target_camera.isFitView
         )
 
-    # --- Two-step apply for Fusion quirks ---
-    # Step 1: Set FOV and camera type
+    # --- Two-step apply for Fusion quirks (skipped when FOV and type already match) ---
     camera = viewport.camera
-    camera.perspectiveAngle = target_camera.perspectiveAngle
-    camera.cameraType = target_camera.cameraType
-    camera.isFitView = False
-    camera.isSmoothTransition = False
-    viewport.camera = camera
+    if _lens_changing(target_camera.cameraType, target_camera.perspectiveAngle,
+                      current_camera.cameraType, current_camera.perspectiveAngle):
+        # Step 1: Set FOV and camera type
+        camera.perspectiveAngle = target_camera.perspectiveAngle
+        camera.cameraType = target_camera.cameraType
+        camera.isFitView = False
+        camera.isSmoothTransition = False
+        viewport.camera = camera
+        camera = viewport.camera
 
     # Step 2: Set eye, target, upVector
-    camera = viewport.camera
     camera.eye = target_camera.eye
     camera.target = target_camera.target
     camera.upVector = target_camera.upVector
@@ -317,9 +416,9 @@ def restore_camera_state(state, app):
     viewport.camera = camera
 
     camera = viewport.camera
-    camera.eye = adsk.core.Point3D.create(*state['eye'])
-    camera.target = adsk.core.Point3D.create(*state['target'])
-    camera.upVector = adsk.core.Vector3D.create(*state['upVector'])
+    camera.eye = _create_point(*state['eye'])
+    camera.target = _create_point(*state['target'])
+    camera.upVector = _create_vector(*state['upVector'])
     camera.isFitView = state.get('isFitView', False)
     camera.isSmoothTransition = state.get('isSmoothTransition', False)
     viewport.camera = camera
@@ -330,7 +429,6 @@ def get_distance_bounds(app, multiplier=4.0):
     Returns min/max camera distance bounds for the current design.
     Used for UI sliders and camera constraints.
     """
-    from ..utilities import camera_calculations
     design = app.activeProduct
     return camera_calculations.distance_bounds_from_design(design, distance_multiplier=multiplier, app=app)
 
@@ -353,7 +451,7 @@ def sanitize_camera_for_type_change(camera, viewport, app, adsk, target_camera_t
         camera.isSmoothTransition = False
         viewport.camera = camera
         viewport.refresh()
-        time.sleep(0.01)
+        # No wait needed: the camera assignment is synchronous, and step 2 re-reads viewport.camera
         # Step 2: Switch to target camera type and apply perspective angle if provided
         if target_camera_type is not None:
             fresh_camera = viewport.camera
@@ -18,6 +18,23 @@ log_utils.set_module_logging(LOG_MODULE, False)
 app = adsk.core.Application.get()
 ui = app.userInterface
 
+# Pre-bound constructors for the per-tick transforms
+_create_point = adsk.core.Point3D.create
+_create_vector = adsk.core.Vector3D.create
+
+# Shared identity returned for Y-up documents, where both canonical transforms are no-ops; never modified
+_IDENTITY = adsk.core.Matrix3D.create()
+
+# (to_canonical, from_canonical) matrices keyed by rounded document up; doc up rarely changes
+_canonical_matrix_cache = {}
+_CANONICAL_CACHE_MAX = 8
+
+# (doc_up, to_canonical, from_canonical) keyed by the design's root component id
+_canonical_frame_cache = {}
+
+# id(matrix) -> (matrix, asArray() tuple); holding the matrix keeps its id from being reused
+_matrix_array_cache = {}
+
 def derive_document_up(design):
     """
     Derive the document's up vector from the front named view.
@@ -37,7 +54,8 @@ def derive_document_up(design):
         up_axis = front_camera.upVector
         up_axis.normalize()
 
-        log_utils.log(app,f'Derived up vector from front named view: ({up_axis.x:.3f}, {up_axis.y:.3f}, {up_axis.z:.3f})', level='DEBUG', module=LOG_MODULE)
+        if log_utils.enabled(LOG_MODULE, 'DEBUG'):
+            log_utils.log(app, 'Derived up vector from front named view: (%.3f, %.3f, %.3f)', up_axis.x, up_axis.y, up_axis.z, level='DEBUG', module=LOG_MODULE)
         return up_axis
         
     except Exception as e:
@@ -50,7 +68,10 @@ def get_to_canonical_matrix(doc_up, adsk):
     """
     Returns a Matrix3D that rotates the document's up vector to canonical Y-up.
     This matrix can be used to transform points/vectors from document space to canonical space.
+    Y-up documents get the shared identity matrix, which must not be modified.
     """
+    if is_canonical_up(doc_up):
+        return _IDENTITY
     canonical_up = adsk.core.Vector3D.create(0, 1, 0)
     m = adsk.core.Matrix3D.create()
     m.setToRotateTo(doc_up, canonical_up)
@@ -60,19 +81,112 @@ def get_from_canonical_matrix(doc_up, adsk):
     """
     Returns a Matrix3D that rotates canonical Y-up to the document's up vector.
     This matrix can be used to transform points/vectors from canonical space back to document space.
+    Y-up documents get the shared identity matrix, which must not be modified.
     """
+    if is_canonical_up(doc_up):
+        return _IDENTITY
     canonical_up = adsk.core.Vector3D.create(0, 1, 0)
     m = adsk.core.Matrix3D.create()
     m.setToRotateTo(canonical_up, doc_up)
     return m
 
+def is_canonical_up(doc_up):
+    """
+    True when the document up is already canonical +Y, so both canonical matrices are the identity.
+    """
+    return doc_up.y > 0.0 and abs(doc_up.x) < 1e-12 and abs(doc_up.z) < 1e-12
+
+def get_canonical_matrices(doc_up, adsk):
+    """
+    Returns (to_canonical, from_canonical) Matrix3D for the document up vector, memoized by its direction.
+    The returned matrices are shared; callers must not modify them.
+    """
+    key = (round(doc_up.x, 9), round(doc_up.y, 9), round(doc_up.z, 9))
+    matrices = _canonical_matrix_cache.get(key)
+    if matrices is None:
+        if len(_canonical_matrix_cache) >= _CANONICAL_CACHE_MAX:
+            _canonical_matrix_cache.clear()
+        matrices = (get_to_canonical_matrix(doc_up, adsk), get_from_canonical_matrix(doc_up, adsk))
+        _canonical_matrix_cache[key] = matrices
+    return matrices
+
+def get_canonical_frame(design, adsk):
+    """
+    Returns (doc_up, to_canonical, from_canonical) for a design, memoized per design so the
+    front named view is only read once. The returned objects are shared; callers must not modify them.
+    """
+    try:
+        key = design.rootComponent.id
+    except Exception:
+        key = None  # No design context: derive_document_up falls back to Z-up
+    frame = _canonical_frame_cache.get(key) if key is not None else None
+    if frame is None:
+        doc_up = derive_document_up(design)
+        frame = (doc_up,) + get_canonical_matrices(doc_up, adsk)
+        if key is not None:
+            if len(_canonical_frame_cache) >= _CANONICAL_CACHE_MAX:
+                _canonical_frame_cache.clear()
+            _canonical_frame_cache[key] = frame
+    return frame
+
+def get_document_up(design):
+    """
+    Returns the document up vector for a design, memoized with its canonical frame (see get_canonical_frame).
+    Use instead of derive_document_up on repeated paths. The vector is shared; callers must not modify it.
+    """
+    return get_canonical_frame(design, adsk)[0]
+
+def clear_canonical_cache(args=None):
+    """
+    Drop memoized canonical frames and matrices (e.g. on palette close, or when the front view may have changed).
+    """
+    _canonical_frame_cache.clear()
+    _canonical_matrix_cache.clear()
+    _matrix_array_cache.clear()
+
+def get_matrix_array(matrix):
+    """
+    Returns matrix.asArray() as a tuple (row-major 4x4), memoized for the shared canonical matrices
+    so hot paths can do the rotation in Python without a Fusion round-trip.
+    """
+    entry = _matrix_array_cache.get(id(matrix))
+    if entry is None or entry[0] is not matrix:
+        if len(_matrix_array_cache) >= _CANONICAL_CACHE_MAX * 2:
+            _matrix_array_cache.clear()
+        entry = (matrix, tuple(matrix.asArray()))
+        _matrix_array_cache[id(matrix)] = entry
+    return entry[1]
+
+def rotate_xyz(m, x, y, z):
+    """
+    Apply the 3x3 rotation part of a row-major matrix array (see get_matrix_array) to plain floats.
+    Used instead of Vector3D.transformBy on per-tick paths.
+    """
+    return (m[0] * x + m[1] * y + m[2] * z,
+            m[4] * x + m[5] * y + m[6] * z,
+            m[8] * x + m[9] * y + m[10] * z)
+
+def transform_points_batch(points, matrix):
+    """
+    Apply a Matrix3D (rotation and translation) to a sequence of (x, y, z) float triples.
+    Reads the matrix once and returns a list of plain tuples, with no Point3D allocated per point.
+    """
+    if matrix is _IDENTITY:
+        return [tuple(point) for point in points]
+    m = get_matrix_array(matrix)
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11 = m[:12]
+    return [(m0 * x + m1 * y + m2 * z + m3,
+             m4 * x + m5 * y + m6 * z + m7,
+             m8 * x + m9 * y + m10 * z + m11) for x, y, z in points]
+
 def transform_vector(vec, matrix, adsk):
     """
     Applies a Matrix3D transform to a Vector3D.
     Returns a new Vector3D in the transformed space.
     """
-    v = adsk.core.Vector3D.create(vec.x, vec.y, vec.z)
-    v.transformBy(matrix)
+    v = _create_vector(vec.x, vec.y, vec.z)
+    if matrix is not _IDENTITY:
+        v.transformBy(matrix)
     return v
 
 def transform_point(pt, matrix, adsk):
@@ -80,8 +194,9 @@ def transform_point(pt, matrix, adsk):
     Applies a Matrix3D transform to a Point3D.
     Returns a new Point3D in the transformed space.
     """
-    p = adsk.core.Point3D.create(pt.x, pt.y, pt.z)
-    p.transformBy(matrix)
+    p = _create_point(pt.x, pt.y, pt.z)
+    if matrix is not _IDENTITY:
+        p.transformBy(matrix)
     return p
 
 def to_canon_point(pt, doc_up, adsk):
@@ -89,7 +204,7 @@ def to_canon_point(pt, doc_up, adsk):
     Transform a Point3D from document space to canonical space.
     This rotates the point so that document up aligns with canonical Y.
     """
-    to_canonical = get_to_canonical_matrix(doc_up, adsk)
+    to_canonical = get_canonical_matrices(doc_up, adsk)[0]
     return transform_point(pt, to_canonical, adsk)
 
 def to_canon_vector(vec, doc_up, adsk):
@@ -97,7 +212,7 @@ def to_canon_vector(vec, doc_up, adsk):
     Transform a Vector3D from document space to canonical space.
     This rotates the vector so that document up aligns with canonical Y.
     """
-    to_canonical = get_to_canonical_matrix(doc_up, adsk)
+    to_canonical = get_canonical_matrices(doc_up, adsk)[0]
     return transform_vector(vec, to_canonical, adsk)
 
 def from_canon_point(pt, doc_up, adsk):
@@ -105,7 +220,7 @@ def from_canon_point(pt, doc_up, adsk):
     Transform a Point3D from canonical space back to document space.
     This rotates the point so that canonical Y aligns with document up.
     """
-    from_canonical = get_from_canonical_matrix(doc_up, adsk)
+    from_canonical = get_canonical_matrices(doc_up, adsk)[1]
     return transform_point(pt, from_canonical, adsk)
 
 def from_canon_vector(vec, doc_up, adsk):
@@ -113,5 +228,5 @@ def from_canon_vector(vec, doc_up, adsk):
     Transform a Vector3D from canonical space back to document space.
     This rotates the vector so that canonical Y aligns with document up.
     """
-    from_canonical = get_from_canonical_matrix(doc_up, adsk)
+    from_canonical = get_canonical_matrices(doc_up, adsk)[1]
     return transform_vector(vec, from_canonical, adsk)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+event_hub.py
+Pooled pub/sub dispatcher for Fusion events.
+
+- Registers exactly one Fusion handler per Fusion event, no matter how many controllers listen.
+- Demultiplexes each event to subscribed Python callables by topic.
+- Bound methods are held weakly so subscribers never keep a controller alive.
+"""
+
+import adsk
+import itertools
+import weakref
+
+LOG_MODULE = 'event_hub'
+
+from ..utilities import log_utils
+log_utils.set_module_logging(LOG_MODULE, False)  # Set True for debugging
+
+app = adsk.core.Application.get()
+
+# =========================
+# TOPICS
+# =========================
+
+CAMERA_CHANGED = 'camera.changed'
+DOCUMENT_SAVED = 'document.saved'
+DOCUMENT_CLOSED = 'document.closed'
+COMMAND_TERMINATED = 'command.terminated'
+
+# =========================
+# GLOBAL STATE VARIABLES
+# =========================
+
+_subscribers = {}      # topic -> {token: callable reference}
+_token_topics = {}     # token -> topic
+_fusion_handlers = {}  # topic -> (fusion event, handler)
+_token_counter = itertools.count(1)
+
+# =========================
+# FUSION HANDLERS
+# =========================
+
+class _CameraChangedHandler(adsk.core.CameraEventHandler):
+    """Single cameraChanged handler shared by all subscribers."""
+    def __init__(self):
+        super().__init__()
+
+    def notify(self, args):
+        publish(CAMERA_CHANGED, args)
+
+class _DocumentSavedHandler(adsk.core.DocumentEventHandler):
+    """Single documentSaved handler shared by all subscribers."""
+    def __init__(self):
+        super().__init__()
+
+    def notify(self, args):
+        publish(DOCUMENT_SAVED, args)
+
+class _DocumentClosedHandler(adsk.core.DocumentEventHandler):
+    """Single documentClosed handler shared by all subscribers."""
+    def __init__(self):
+        super().__init__()
+
+    def notify(self, args):
+        publish(DOCUMENT_CLOSED, args)
+
+class _CommandTerminatedHandler(adsk.core.ApplicationCommandEventHandler):
+    """Single commandTerminated handler shared by all subscribers."""
+    def __init__(self):
+        super().__init__()
+
+    def notify(self, args):
+        publish(COMMAND_TERMINATED, args)
+
+_FUSION_EVENTS = {
+    CAMERA_CHANGED: (lambda: app.cameraChanged, _CameraChangedHandler),
+    DOCUMENT_SAVED: (lambda: app.documentSaved, _DocumentSavedHandler),
+    DOCUMENT_CLOSED: (lambda: app.documentClosed, _DocumentClosedHandler),
+    COMMAND_TERMINATED: (lambda: app.userInterface.commandTerminated, _CommandTerminatedHandler),
+}
+
+def _attach_fusion_handler(topic):
+    """
+    Add the shared Fusion handler for a topic if it is not attached yet.
+    """
+    if topic in _fusion_handlers or topic not in _FUSION_EVENTS:
+        return
+    get_event, handler_class = _FUSION_EVENTS[topic]
+    event = get_event()
+    handler = handler_class()
+    event.add(handler)
+    _fusion_handlers[topic] = (event, handler)  # Keep a reference!
+
+def _detach_fusion_handler(topic):
+    """
+    Remove the shared Fusion handler for a topic.
+    """
+    entry = _fusion_handlers.pop(topic, None)
+    if entry is None:
+        return
+    event, handler = entry
+    try:
+        event.remove(handler)
+    except Exception as e:
+        log_utils.log(app, f'❌ Failed to remove {topic} handler: {str(e)}', level='ERROR', module=LOG_MODULE)
+
+# =========================
+# PUB/SUB API
+# =========================
+
+def subscribe(topic, fn):
+    """
+    Subscribe a callable to a topic. Returns a token for unsubscribe().
+    """
+    ref = weakref.WeakMethod(fn) if hasattr(fn, '__self__') else (lambda: fn)
+    token = next(_token_counter)
+    _subscribers.setdefault(topic, {})[token] = ref
+    _token_topics[token] = topic
+    _attach_fusion_handler(topic)
+    return token
+
+def unsubscribe(token):
+    """
+    Remove a subscription. Detaches the Fusion handler when the last subscriber leaves.
+    """
+    topic = _token_topics.pop(token, None)
+    if topic is None:
+        return
+    subscribers = _subscribers.get(topic, {})
+    subscribers.pop(token, None)
+    if not subscribers:
+        _subscribers.pop(topic, None)
+        _detach_fusion_handler(topic)
+
+def publish(topic, args=None):
+    """
+    Dispatch an event to every live subscriber of a topic.
+    """
+    for token, ref in list(_subscribers.get(topic, {}).items()):
+        fn = ref()
+        if fn is None:
+            unsubscribe(token)
+            continue
+        try:
+            fn(args)
+        except Exception as e:
+            log_utils.log(app, f'❌ Subscriber for {topic} failed: {str(e)}', level='ERROR', module=LOG_MODULE)
+
+def clear():
+    """
+    Remove all subscriptions and Fusion handlers.
+    """
+    for topic in list(_fusion_handlers):
+        _detach_fusion_handler(topic)
+    _subscribers.clear()
+    _token_topics.clear()
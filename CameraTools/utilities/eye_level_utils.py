@@ -10,13 +10,16 @@ Core eye level utilities for CameraTools.
 
 import adsk
 import adsk.fusion
+import functools
+import math
 import time
 
 LOG_MODULE = 'eye_level_utils'
 
 from ..utilities import log_utils
-from ..utilities.camera_transforms import derive_document_up
-from ..utilities import camera_telemetry
+from ..utilities.camera_transforms import get_document_up
+from ..utilities import camera_telemetry, prefs_utils
+from ..utilities import camera_calculations as _camera_calculations, camera_transforms as _camera_transforms
 
 log_utils.set_module_logging(LOG_MODULE, False)  # Set True for debugging
 
@@ -56,9 +59,10 @@ def get_eye_level(camera=None):
         if design is None:
             log_utils.log(app, "❌ No active design/product. get_eye_level aborted.", level='ERROR', module=LOG_MODULE)
             return 0.0
-        up_vector = derive_document_up(design)
-        # Project eye point onto up vector (dot product)
-        return camera.eye.asVector().dotProduct(up_vector)
+        up_vector = get_document_up(design)
+        # Project eye point onto up vector (dot product, in Python to skip the asVector allocation)
+        ex, ey, ez = camera.eye.asArray()
+        return ex * up_vector.x + ey * up_vector.y + ez * up_vector.z
     except Exception as e:
         log_utils.log(app, f"❌ Exception in get_eye_level: {str(e)}", level='ERROR', module=LOG_MODULE)
         return 0.0
@@ -75,9 +79,10 @@ def get_target_level(camera=None):
         if design is None:
             log_utils.log(app, "❌ No active design/product. get_target_level aborted.", level='ERROR', module=LOG_MODULE)
             return 0.0
-        up_vector = derive_document_up(design)
-        # Project target point onto up vector (dot product)
-        return camera.target.asVector().dotProduct(up_vector)
+        up_vector = get_document_up(design)
+        # Project target point onto up vector (dot product, in Python to skip the asVector allocation)
+        tx, ty, tz = camera.target.asArray()
+        return tx * up_vector.x + ty * up_vector.y + tz * up_vector.z
     except Exception as e:
         log_utils.log(app, f"❌ Exception in get_target_level: {str(e)}", level='ERROR', module=LOG_MODULE)
         return 0.0
@@ -86,30 +91,39 @@ def get_target_level(camera=None):
 # EYE LEVEL LOCK STATE MANAGEMENT (Preferences only)
 # =========================
 
+# In-memory mirror of the two lock prefs: (enabled, target_level). Loaded on first read and
+# kept current by set_eye_level_lock_state, the only writer, so reads never touch prefs
+_lock_state = None
+
+# (root component id, min_eye_level, max_eye_level) for validate_eye_level_range
+_range_cache = None
+
+def _get_lock_state():
+    global _lock_state
+    if _lock_state is None:
+        try:
+            prefs = prefs_utils.load_prefs()
+            _lock_state = (prefs.get('eyeLevelLocked', False), prefs.get('eyeLevelTarget', 0.0))
+        except Exception:
+            return (False, 0.0)
+    return _lock_state
+
 def get_eye_level_lock_status():
     """
     Get eye level lock status and target from preferences.
     Returns a dict: {'enabled': bool, 'target_level': float}
     """
-    try:
-        from . import prefs_utils
-        prefs = prefs_utils.load_prefs() or {}
-        enabled = prefs.get('eyeLevelLocked', False)
-        target = prefs.get('eyeLevelTarget', 0.0)
-        return {'enabled': enabled, 'target_level': target}
-    except Exception:
-        return {'enabled': False, 'target_level': 0.0}
+    enabled, target = _get_lock_state()
+    return {'enabled': enabled, 'target_level': target}
 
 def set_eye_level_lock_state(enabled, target_level_cm=0.0):
     """
     Set eye level lock state and persist to preferences.
     """
+    global _lock_state
     try:
-        from . import prefs_utils
-        preferences = prefs_utils.load_prefs() or {}
-        preferences["eyeLevelLocked"] = bool(enabled)
-        preferences["eyeLevelTarget"] = float(target_level_cm)
-        prefs_utils.save_prefs(preferences)
+        _lock_state = (bool(enabled), float(target_level_cm))
+        prefs_utils.update_prefs({"eyeLevelLocked": _lock_state[0], "eyeLevelTarget": _lock_state[1]})
         return True
     except Exception:
         return False
@@ -118,13 +132,13 @@ def is_eye_level_lock_active():
     """
     Check if eye level lock is currently active.
     """
-    return get_eye_level_lock_status().get('enabled', False)
+    return _get_lock_state()[0]
 
 def get_eye_level_lock_target():
     """
     Get the current eye level lock target.
     """
-    return get_eye_level_lock_status().get('target_level', 0.0)
+    return _get_lock_state()[1]
 
 def disable_eye_level_lock():
     """
@@ -146,7 +160,6 @@ def easeInOutSine(t):
     """
     Easing function for smooth animation (sine curve).
     """
-    import math
     return -(math.cos(math.pi * t) - 1) / 2
 
 def easeInOutCubic(t):
@@ -160,73 +173,92 @@ def easeInOutCubic(t):
         t -= 2
         return (t * t * t + 2) / 2
 
+@functools.lru_cache(maxsize=8)
+def eased_steps(steps, easing=easeInOutCubic):
+    """
+    Eased progress for each step (1..steps) of an animation, built once per step count and reused.
+    """
+    return tuple(easing((i + 1) / steps) for i in range(steps))
+
 def animate_eye_level(eye_level, duration=0.1, fps=30, palette=None, camera_calculations=None, camera_transforms=None):
     """
     Animate the camera's eye point to the specified level over a given duration.
     Target remains unchanged, preserving the camera's look direction.
     """
     if camera_transforms is None:
-        from ..utilities import camera_transforms
+        camera_transforms = _camera_transforms
 
-    camera = app.activeViewport.camera
+    viewport = app.activeViewport
+    camera = viewport.camera
     design = app.activeProduct
     if design is None:
         log_utils.log(app, "❌ No active design/product. Animation aborted.", level='ERROR', module=LOG_MODULE)
         return False
     
-    up_vector = derive_document_up(design)
-    start_eye = camera.eye.asVector()
-    start_eye_level = start_eye.dotProduct(up_vector)
+    # Document up and start eye as plain floats, read once; the loop is pure scalar math
+    up_vector = get_document_up(design)
+    ux, uy, uz = up_vector.x, up_vector.y, up_vector.z
+    sx, sy, sz = camera.eye.asArray()
+    start_eye_level = sx * ux + sy * uy + sz * uz
     eye_delta = eye_level - start_eye_level
     steps = max(1, int(duration * fps / 1000))
     interval = duration / steps
 
-    for i in range(steps):
-        t = (i + 1) / steps
-        eased_t = easeInOutCubic(t)
-        
-        # Interpolate eye level only
+    progress = eased_steps(steps)
+    last_step = len(progress) - 1
+    start_time = time.monotonic()
+
+    for i, eased_t in enumerate(progress):
+        # Interpolate eye level only: move the start eye along the up vector
         new_eye_level = start_eye_level + eye_delta * eased_t
 
-        # Move eye along up vector
-        eye_offset = up_vector.copy()
-        eye_offset.scaleBy(new_eye_level - start_eye_level)
-        new_eye = start_eye.copy()
-        new_eye.x += eye_offset.x
-        new_eye.y += eye_offset.y
-        new_eye.z += eye_offset.z
-
-        # Update camera (target stays the same)
-        camera.eye = adsk.core.Point3D.create(new_eye.x, new_eye.y, new_eye.z)
-        app.activeViewport.camera = camera
-        app.activeViewport.refresh()
+        # Update camera (target stays the same). Assigning the viewport camera is the one redraw
+        # trigger per step; doEvents lets it paint, so an extra refresh() would only redraw twice
+        camera.eye = adsk.core.Point3D.create(*_camera_calculations.point_at_level(sx, sy, sz, ux, uy, uz, new_eye_level))
+        viewport.camera = camera
         adsk.doEvents()
-        
-        # Send camera state to UI
-        camera_telemetry.send_camera_state_to_ui(
-            palette, app, adsk, camera_calculations, camera_transforms
-        )
-    
-        time.sleep(interval)
+
+        # Frame pacing against a monotonic deadline, so slow API calls shorten sleeps instead of stretching the animation
+        remaining = start_time + (i + 1) * interval - time.monotonic()
+
+        # Send camera state to UI every other step while on schedule, and always on the final step
+        if i == last_step or (i % 2 == 0 and remaining > 0):
+            camera_telemetry.send_camera_state_to_ui(
+                palette, app, adsk, camera_calculations, camera_transforms
+            )
+            remaining = start_time + (i + 1) * interval - time.monotonic()
+
+        if i != last_step and remaining > 0:
+            time.sleep(remaining)
 
 # =========================
 # VALIDATION
 # =========================
 
+def invalidate_eye_level_range(args=None):
+    """
+    Drop the cached eye level range so the next validation re-reads the bounding box (e.g. after a command edits geometry).
+    """
+    global _range_cache
+    _range_cache = None
+
 def validate_eye_level_range(eye_level_cm):
     """
     Validate that eye level is within reasonable bounds for the model.
-    Checks against the model's bounding box height.
+    Checks against the model's bounding box height, cached per root component until invalidated.
     """
+    global _range_cache
     try:
         design = app.activeProduct
         if isinstance(design, adsk.fusion.Design):
             root_comp = design.rootComponent
-            bounding_box = root_comp.boundingBox
-            model_height = abs(bounding_box.maxPoint.z - bounding_box.minPoint.z)
-            model_center_z = (bounding_box.maxPoint.z + bounding_box.minPoint.z) / 2
-            min_eye_level = model_center_z - model_height
-            max_eye_level = model_center_z + model_height
+            key = root_comp.id
+            if _range_cache is None or _range_cache[0] != key:
+                bounding_box = root_comp.boundingBox
+                model_height = abs(bounding_box.maxPoint.z - bounding_box.minPoint.z)
+                model_center_z = (bounding_box.maxPoint.z + bounding_box.minPoint.z) / 2
+                _range_cache = (key, model_center_z - model_height, model_center_z + model_height)
+            _, min_eye_level, max_eye_level = _range_cache
             return min_eye_level <= eye_level_cm <= max_eye_level
         else:
             # Fallback for no design context
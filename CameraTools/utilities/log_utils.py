@@ -1,5 +1,6 @@
 import adsk
 import datetime
+import traceback
 
 LOGGING_ENABLED = True  # MASTER Toggle this to enable/disable logging
 INCLUDE_TIMESTAMPS = True  # Toggle this to enable/disable timestamps
@@ -34,9 +35,18 @@ def set_timestamps(enabled: bool):
 # Reset all module logging states
 def set_module_logging(module, enabled: bool):
     MODULE_LOGGING_ENABLED[module] = enabled
+
+# Cheap check for hot paths: skip building an f-string message that log() would drop anyway
+def enabled(module=None, level='INFO'):
+    if not LOGGING_ENABLED or LOG_LEVELS[level] < current_log_level:
+        return False
+    return module is None or MODULE_LOGGING_ENABLED.get(module, True)
     
 # If module is not in the dict, it defaults to True
-def log(app, message, level='INFO', module=None):
+# exc_info=True appends the current exception's traceback, formatted only if the message is actually logged
+# Extra positional args are %-formatted into message lazily, after every filter, so hot paths can
+# write log(app, 'x=%.3f', x, level='DEBUG', ...) and pay nothing when the message is dropped
+def log(app, message, *args, level='INFO', module=None, exc_info=False):
     if not LOGGING_ENABLED:
         return
     # Special case for message breaks
@@ -53,6 +63,10 @@ def log(app, message, level='INFO', module=None):
         message = f"{message} -->[from {module}]"
     if LOG_LEVELS[level] < current_log_level:
         return
+    if args:
+        message = message % args
+    if exc_info:
+        message = f"{message}\n{traceback.format_exc()}"
     if INCLUDE_TIMESTAMPS:
         now = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
         app.log(f'[{now}] {message}')
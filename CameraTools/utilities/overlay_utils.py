@@ -10,6 +10,7 @@ Core overlay drawing and state utilities for CameraTools.
 
 import adsk
 import adsk.fusion
+import functools
 import math
 import traceback
 
@@ -21,6 +22,7 @@ log_utils.set_module_logging(LOG_MODULE, False)  # Set True for deployment
 app = adsk.core.Application.get()
 ui = app.userInterface
 overlay_cg_group = None
+repaint_scheduler = None  # Set by the overlay controller to coalesce repaints onto one trailing-edge pass
 
 # =========================
 # GLOBAL STATE VARIABLES
@@ -39,6 +41,26 @@ HALVES_COLOR = (0, 255, 255, 128)  # Cyan
 THIRDS_COLOR = (255, 128, 0, 64)   # Orange  
 QUARTERS_COLOR = (0, 128, 255, 64) # Blue
 
+ASPECT_RATIOS = {'16:9': 16/9, '4:3': 4/3, '1:1': 1}
+
+# Mesh template objects shared by every overlay mesh; repaint would otherwise rebuild them per mesh
+_ORIGIN = adsk.core.Point3D.create(0, 0, 0)
+_SCREEN_BILLBOARD = adsk.fusion.CustomGraphicsBillBoard.create(_ORIGIN)
+_SCREEN_BILLBOARD.billBoardStyle = adsk.fusion.CustomGraphicsBillBoardStyles.ScreenBillBoardStyle
+_VIEW_SCALE = adsk.fusion.CustomGraphicsViewScale.create(1, _ORIGIN)
+
+# Two-triangle quad topology, identical for every overlay mesh. Kept as lists (the API's
+# vector arguments are typed as lists) and only ever read, so one object serves every addMesh.
+_QUAD_INDICES = [0, 1, 2, 0, 2, 3]
+_QUAD_NORMALS = [0.0, 0.0, 1.0] * 4
+
+@functools.lru_cache(maxsize=16)
+def _color(rgba):
+    """
+    Returns a shared adsk.core.Color for an (r, g, b, a) tuple.
+    """
+    return adsk.core.Color.create(*rgba)
+
 # =========================
 # CORE OVERLAY UTILITIES
 # =========================
@@ -51,10 +73,11 @@ def get_overlay_cg_group(design):
     global overlay_cg_group
     if overlay_cg_group is not None:
         try:
-            _ = overlay_cg_group.isValid
-            return overlay_cg_group
-        except:
-            overlay_cg_group = None
+            if overlay_cg_group.isValid:
+                return overlay_cg_group
+        except RuntimeError:
+            pass  # Fusion API errors surface as RuntimeError; treat as a stale handle
+        overlay_cg_group = None
     overlay_cg_group = design.rootComponent.customGraphicsGroups.add()
     return overlay_cg_group
 
@@ -66,8 +89,8 @@ def clear_overlay_graphics():
     if overlay_cg_group is not None:
         try:
             overlay_cg_group.deleteMe()
-        except:
-            pass
+        except RuntimeError:
+            pass  # Already deleted with its document
         overlay_cg_group = None
     log_utils.log(app, '🧹 Cleared overlay graphics', level='INFO', module=LOG_MODULE)
 
@@ -82,12 +105,19 @@ def clear_all_custom_graphics():
         design = app.activeProduct
         if not isinstance(design, adsk.fusion.Design):
             return
-        def clear_groups(comp):
-            for cg_group in comp.customGraphicsGroups:
+        # Walk the occurrence tree iteratively (deep assemblies would recurse), collecting every
+        # group first so no collection is mutated while it is being iterated
+        groups = []
+        stack = [design.rootComponent]
+        while stack:
+            comp = stack.pop()
+            groups.extend(comp.customGraphicsGroups)
+            stack.extend(occ.component for occ in comp.occurrences)
+        for cg_group in groups:
+            try:
                 cg_group.deleteMe()
-            for occ in comp.occurrences:
-                clear_groups(occ.component)
-        clear_groups(design.rootComponent)
+            except Exception:
+                pass
         log_utils.log(app, '🧹 Cleared all custom graphics', level='INFO', module=LOG_MODULE)
     except Exception as e:
         log_utils.log(app, f'❌ Failed to clear custom graphics: {str(e)}', level='ERROR', module=LOG_MODULE)
@@ -101,20 +131,16 @@ def get_aspect_fit_rect(viewport_width, viewport_height, target_aspect):
     Calculates the largest centered rectangle with the target aspect ratio that fits in the viewport.
     Returns (rect_x, rect_y, rect_width, rect_height) in pixel space.
     """
-    viewport_aspect = viewport_width / viewport_height
-    if viewport_aspect > target_aspect:
-        # Pillarbox: fit height, adjust width
-        rect_height = viewport_height
-        rect_width = rect_height * target_aspect
-        rect_x = (viewport_width - rect_width) / 2
-        rect_y = 0
-    else:
-        # Letterbox: fit width, adjust height
-        rect_width = viewport_width
-        rect_height = rect_width / target_aspect
-        rect_x = 0
-        rect_y = (viewport_height - rect_height) / 2
-    return rect_x, rect_y, rect_width, rect_height
+    # Aspect quantized so float noise in width/height ratios doesn't defeat the cache
+    return _aspect_fit_rect(viewport_width, viewport_height, round(target_aspect, 9))
+
+@functools.lru_cache(maxsize=16)
+def _aspect_fit_rect(viewport_width, viewport_height, target_aspect):
+    # One formula for both cases: the height that fits is capped by the viewport height (pillarbox)
+    # or by the viewport width (letterbox); the rect is then centered on both axes
+    rect_height = min(viewport_width / target_aspect, viewport_height)
+    rect_width = rect_height * target_aspect
+    return (viewport_width - rect_width) / 2, (viewport_height - rect_height) / 2, rect_width, rect_height
 
 def create_aspect_ratio_mask(design, mode='16:9', color=(0, 0, 0, 64), opacity=1):
     """
@@ -127,78 +153,89 @@ def create_aspect_ratio_mask(design, mode='16:9', color=(0, 0, 0, 64), opacity=1
         width = viewport.width * 2
         height = viewport.height * 2
 
-        aspect_map = {'16:9': 16/9, '4:3': 4/3, '1:1': 1}
-        if mode not in aspect_map:
+        if mode not in ASPECT_RATIOS:
             return
 
-        rect_x, rect_y, rect_w, rect_h = get_aspect_fit_rect(width, height, aspect_map[mode])
+        rect_x, rect_y, rect_w, rect_h = get_aspect_fit_rect(width, height, ASPECT_RATIOS[mode])
 
+        panels = []
         # Top mask (above fit rect)
         if rect_y > 0:
-            create_mask_panel(cgGroup, 0, 0, width, -rect_y/2, color, opacity)
+            panels.append((0, 0, width, -rect_y/2))
         # Bottom mask (below fit rect)
         if rect_y + rect_h < height:
-            create_mask_panel(cgGroup, 0, rect_y + rect_h, width, -(height - (rect_y + rect_h/2)), color, opacity)
+            panels.append((0, rect_y + rect_h, width, -(height - (rect_y + rect_h/2))))
         # Left mask (left of fit rect)
         if rect_x > 0:
-            create_mask_panel(cgGroup, 0, rect_y/2, rect_x/2, -rect_h/2, color, opacity)
+            panels.append((0, rect_y/2, rect_x/2, -rect_h/2))
         # Right mask (right of fit rect)
         if rect_x + rect_w < width:
-            create_mask_panel(cgGroup, rect_x + rect_w, rect_y, width - (rect_x + rect_w/2), -rect_h, color, opacity)
+            panels.append((rect_x + rect_w, rect_y, width - (rect_x + rect_w/2), -rect_h))
+        create_mask_panels(cgGroup, panels, color, opacity)
     except Exception as e:
         log_utils.log(app,f'❌ Failed to create aspect ratio mask: {str(e)}', level='ERROR', module=LOG_MODULE)
 
-def create_mask_panel(cgGroup, x, y, w, h, color, opacity):    
+def create_mask_panels(cgGroup, panels, color, opacity):
     """
-    Draws a rectangular mask panel at (x, y) of size (w, h) in screen space.
+    Draws rectangular mask panels, each (x, y, w, h) in screen space, as a single mesh.
     Used for aspect ratio overlays.
     """
-    coords = [
-        0, 0, 0,
-        w, 0, 0,
-        w, h, 0,
-        0, h, 0
-    ]
+    if not panels:
+        return
+    coords = []
+    indices = []
+    for i, (x, y, w, h) in enumerate(panels):
+        # The mesh is placed once at the upper-left corner, so each panel's screen offset
+        # (y grows downward on screen, upward in mesh coordinates) is folded into its vertices
+        top = -y
+        coords.extend((
+            x, top, 0,
+            x + w, top, 0,
+            x + w, top + h, 0,
+            x, top + h, 0
+        ))
+        base = i * 4
+        indices.extend(base + index for index in _QUAD_INDICES)
     coordObj = adsk.fusion.CustomGraphicsCoordinates.create(coords)
-    indices = [0, 1, 2, 0, 2, 3]
-    normals = [0.0, 0.0, 1.0] * 4
-    normalIndexList = [0, 1, 2, 0, 2, 3]
-    mesh = cgGroup.addMesh(coordObj, indices, normals, normalIndexList)
+    # Every panel faces the viewer: one normal, referenced by every vertex index
+    mesh = cgGroup.addMesh(coordObj, indices, _QUAD_NORMALS[:3], [0] * len(indices))
     mesh.isSelectable = False
     showThrough = adsk.fusion.CustomGraphicsShowThroughColorEffect.create(
-        adsk.core.Color.create(*color), opacity
+        _color(color), opacity
     )
     mesh.color = showThrough
-    billBoard = adsk.fusion.CustomGraphicsBillBoard.create(adsk.core.Point3D.create(0,0,0))
-    billBoard.billBoardStyle = adsk.fusion.CustomGraphicsBillBoardStyles.ScreenBillBoardStyle 
-    mesh.billBoarding = billBoard
-    mesh.viewScale = adsk.fusion.CustomGraphicsViewScale.create(1, adsk.core.Point3D.create(0,0,0))
+    mesh.billBoarding = _SCREEN_BILLBOARD
+    mesh.viewScale = _VIEW_SCALE
     mesh.viewPlacement = adsk.fusion.CustomGraphicsViewPlacement.create(
-        adsk.core.Point3D.create(0,0,0),
+        _ORIGIN,
         adsk.fusion.ViewCorners.upperLeftViewCorner,
-        adsk.core.Point2D.create(x, y)
+        adsk.core.Point2D.create(0, 0)
     )
 
 # =========================
 # GRID UTILITIES
 # =========================
 
-def create_grid_overlay(design, fractions=None, color=(63,127,255,128), thickness=1):
+def get_grid_rect():
+    """
+    Returns the aspect-fit rectangle grids are drawn into, for the current viewport and aspect ratio.
+    """
+    viewport = app.activeViewport
+    width = viewport.width * 2
+    height = viewport.height * 2
+    aspect = ASPECT_RATIOS.get(current_aspect_ratio, width/height)
+    return get_aspect_fit_rect(width, height, aspect)
+
+def create_grid_overlay(design, fractions=None, color=(63,127,255,128), thickness=1, rect=None):
     """
     Draws grid lines at the specified fractions of the aspect-fit rectangle.
-    Used for halves/thirds/quarters overlays.
+    Used for halves/thirds/quarters overlays. Pass rect (from get_grid_rect) to skip re-reading the viewport.
     """
     cgGroup = get_overlay_cg_group(design)
     if fractions is None:
         return
     try:
-        viewport = app.activeViewport
-        width = viewport.width * 2
-        height = viewport.height * 2
-
-        aspect_map = {'16:9': 16/9, '4:3': 4/3, '1:1': 1}
-        aspect = aspect_map.get(current_aspect_ratio, width/height)
-        rect_x, rect_y, rect_w, rect_h = get_aspect_fit_rect(width, height, aspect)
+        rect_x, rect_y, rect_w, rect_h = rect if rect is not None else get_grid_rect()
 
         # Vertical lines
         for frac in fractions:
@@ -233,21 +270,16 @@ def create_grid_line_mesh(cgGroup, x, y, w, h, thickness, color):
         ]
         offset = adsk.core.Point2D.create(x, y)
     coordObj = adsk.fusion.CustomGraphicsCoordinates.create(coords)
-    indices = [0, 1, 2, 0, 2, 3]
-    normals = [0.0, 0.0, 1.0] * 4
-    normalIndexList = [0, 1, 2, 0, 2, 3]
-    mesh = cgGroup.addMesh(coordObj, indices, normals, normalIndexList)
+    mesh = cgGroup.addMesh(coordObj, _QUAD_INDICES, _QUAD_NORMALS, _QUAD_INDICES)
     mesh.isSelectable = False
     showThrough = adsk.fusion.CustomGraphicsShowThroughColorEffect.create(
-        adsk.core.Color.create(*color), 1
+        _color(color), 1
     )
     mesh.color = showThrough
-    billBoard = adsk.fusion.CustomGraphicsBillBoard.create(adsk.core.Point3D.create(0,0,0))
-    billBoard.billBoardStyle = adsk.fusion.CustomGraphicsBillBoardStyles.ScreenBillBoardStyle 
-    mesh.billBoarding = billBoard
-    mesh.viewScale = adsk.fusion.CustomGraphicsViewScale.create(1, adsk.core.Point3D.create(0,0,0))
+    mesh.billBoarding = _SCREEN_BILLBOARD
+    mesh.viewScale = _VIEW_SCALE
     mesh.viewPlacement = adsk.fusion.CustomGraphicsViewPlacement.create(
-        adsk.core.Point3D.create(0,0,0),
+        _ORIGIN,
         adsk.fusion.ViewCorners.upperLeftViewCorner,
         offset
     )
@@ -265,16 +297,30 @@ def repaint(design):
         clear_overlay_graphics()
         if current_aspect_ratio in ['default', '16:9', '4:3', '1:1']:
             create_aspect_ratio_mask(design, mode=current_aspect_ratio)
-        if halves_enabled:
-            create_grid_overlay(design, fractions=HALVES, color=HALVES_COLOR)
-        if thirds_enabled:
-            create_grid_overlay(design, fractions=THIRDS, color=THIRDS_COLOR)
-        if quarters_enabled:
-            create_grid_overlay(design, fractions=QUARTERS, color=QUARTERS_COLOR)
+        grids = [(fractions, color) for enabled, fractions, color in (
+            (halves_enabled, HALVES, HALVES_COLOR),
+            (thirds_enabled, THIRDS, THIRDS_COLOR),
+            (quarters_enabled, QUARTERS, QUARTERS_COLOR)
+        ) if enabled]
+        if grids:
+            # One viewport read and fit rect for every enabled grid
+            rect = get_grid_rect()
+            for fractions, color in grids:
+                create_grid_overlay(design, fractions=fractions, color=color, rect=rect)
         log_utils.log(app, '🔄 Repainted overlays successfully', level='INFO', module=LOG_MODULE)
     except Exception as e:
         log_utils.log(app,f'❌ Failed to repaint: {str(e)}', level='ERROR', module=LOG_MODULE)
 
+def request_repaint(design):
+    """
+    Repaints overlays, deferred through repaint_scheduler when one is installed so a burst of
+    state changes collapses into a single clear-and-redraw.
+    """
+    if repaint_scheduler is not None:
+        repaint_scheduler()
+    else:
+        repaint(design)
+
 # =========================
 # STATE MANAGEMENT FUNCTIONS
 # =========================
@@ -287,7 +333,7 @@ def update_aspect_ratio(aspect_ratio):
     current_aspect_ratio = aspect_ratio
     des = app.activeProduct
     if isinstance(des, adsk.fusion.Design):
-        repaint(des)
+        request_repaint(des)
 
 def toggle_grid_halves(enabled):
     """
@@ -297,7 +343,7 @@ def toggle_grid_halves(enabled):
     halves_enabled = enabled
     des = app.activeProduct
     if isinstance(des, adsk.fusion.Design):
-        repaint(des)
+        request_repaint(des)
 
 def toggle_grid_thirds(enabled):
     """
@@ -307,7 +353,7 @@ def toggle_grid_thirds(enabled):
     thirds_enabled = enabled
     des = app.activeProduct
     if isinstance(des, adsk.fusion.Design):
-        repaint(des)
+        request_repaint(des)
 
 def toggle_grid_quarters(enabled):
     """
@@ -317,7 +363,13 @@ def toggle_grid_quarters(enabled):
     quarters_enabled = enabled
     des = app.activeProduct
     if isinstance(des, adsk.fusion.Design):
-        repaint(des)
+        request_repaint(des)
+
+GRID_TOGGLES = {
+    'halves': toggle_grid_halves,
+    'thirds': toggle_grid_thirds,
+    'quarters': toggle_grid_quarters
+}
 
 # =========================
 # DEBUG UTILITIES
@@ -334,8 +386,7 @@ def draw_debug_fit_rect(design, color=(0, 255, 255, 60)):
         width = viewport.width * 1
         height = viewport.height * 1
 
-        aspect_map = {'16:9': 16/9, '4:3': 4/3, '1:1': 1}
-        aspect = aspect_map.get(current_aspect_ratio, width/height)
+        aspect = ASPECT_RATIOS.get(current_aspect_ratio, width/height)
         rect_x, rect_y, rect_w, rect_h = get_aspect_fit_rect(width, height, aspect)
 
         coords = [
@@ -345,21 +396,16 @@ def draw_debug_fit_rect(design, color=(0, 255, 255, 60)):
             0, -rect_h, 0
         ]
         coordObj = adsk.fusion.CustomGraphicsCoordinates.create(coords)
-        indices = [0, 1, 2, 0, 2, 3]
-        normals = [0.0, 0.0, 1.0] * 4
-        normalIndexList = [0, 1, 2, 0, 2, 3]
-        mesh = cgGroup.addMesh(coordObj, indices, normals, normalIndexList)
+        mesh = cgGroup.addMesh(coordObj, _QUAD_INDICES, _QUAD_NORMALS, _QUAD_INDICES)
         mesh.isSelectable = False
         showThrough = adsk.fusion.CustomGraphicsShowThroughColorEffect.create(
-            adsk.core.Color.create(*color), 1
+            _color(color), 1
         )
         mesh.color = showThrough
-        billBoard = adsk.fusion.CustomGraphicsBillBoard.create(adsk.core.Point3D.create(0,0,0))
-        billBoard.billBoardStyle = adsk.fusion.CustomGraphicsBillBoardStyles.ScreenBillBoardStyle 
-        mesh.billBoarding = billBoard
-        mesh.viewScale = adsk.fusion.CustomGraphicsViewScale.create(1, adsk.core.Point3D.create(0,0,0))
+        mesh.billBoarding = _SCREEN_BILLBOARD
+        mesh.viewScale = _VIEW_SCALE
         mesh.viewPlacement = adsk.fusion.CustomGraphicsViewPlacement.create(
-            adsk.core.Point3D.create(0,0,0),
+            _ORIGIN,
             adsk.fusion.ViewCorners.upperLeftViewCorner,
             adsk.core.Point2D.create(rect_x*2, rect_y*2)
         )
@@ -381,14 +427,10 @@ def set_grid_overlay(grid_type, enabled):
     Enables/disables the specified grid overlay and triggers repaint.
     """
     try:
-        if grid_type == 'halves':
-            toggle_grid_halves(enabled)
-        elif grid_type == 'thirds':
-            toggle_grid_thirds(enabled)
-        elif grid_type == 'quarters':
-            toggle_grid_quarters(enabled)
-        else:
+        toggle = GRID_TOGGLES.get(grid_type)
+        if toggle is None:
             log_utils.log(app,f'Unknown grid type: {grid_type}', level='INFO', module=LOG_MODULE)
-            return            
+            return
+        toggle(enabled)
     except Exception as e:
         log_utils.log(app,f'❌ Failed to set grid overlay: {str(e)}', level='ERROR', module=LOG_MODULE)
\ No newline at end of file
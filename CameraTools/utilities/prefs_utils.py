@@ -1,5 +1,9 @@
+import functools
 import os
+import queue
 import sys
+import threading
+import time
 import adsk # type: ignore
 import json
 LOG_MODULE = 'prefs_utils'
@@ -19,6 +23,8 @@ DEFAULT_PREFS = {
 # This script manages preferences for the CameraTools add-in, including saving and loading preferences to a JSON file.
 
 # Get the path for the preferences file based on the operating system
+# Resolved on first prefs access rather than at import, then memoized
+@functools.lru_cache(maxsize=1)
 def get_prefs_path():
     if sys.platform == "win32":
         base = os.environ.get("APPDATA", os.path.expanduser("~"))
@@ -26,41 +32,129 @@ def get_prefs_path():
     else:
         base = os.path.expanduser("~/Library/Application Support/Autodesk")
         prefs_dir = os.path.join(base, "CameraTools")
-    if not os.path.exists(prefs_dir):
-        os.makedirs(prefs_dir)
+    os.makedirs(prefs_dir, exist_ok=True)
     return os.path.join(prefs_dir, "prefs.json")
 
-PREFS_PATH = get_prefs_path()
+SAVE_DEBOUNCE = 0.25  # Seconds to collect bursts of toggles into one disk write
 
-# Save preferences to a JSON file
-def save_prefs(prefs):
+# In-memory prefs cache, keyed by the file's mtime when it was read
+_cached_prefs = None
+_cached_mtime = None
+_save_lock = threading.Lock()
+
+# Disk writes run on one daemon worker; the queue only carries wake-ups, the cache holds the latest prefs
+_write_pending = False
+_writer_queue = None
+_writer_thread = None
+_WRITER_STOP = object()
+
+def _file_mtime():
     try:
-        with open(PREFS_PATH, "w") as f:
-            json.dump(prefs, f)
-            log_utils.log(app,f"✅ Preferences saved to {PREFS_PATH}", level='INFO', module=LOG_MODULE)
+        return os.stat(get_prefs_path()).st_mtime_ns
+    except OSError:
+        return None
+
+# Write the cached preferences to disk if a save is pending
+def _write_prefs():
+    global _write_pending, _cached_mtime
+    with _save_lock:
+        if not _write_pending:
+            return
+        _write_pending = False
+        prefs = _cached_prefs
+    if prefs is None:
+        return
+    try:
+        payload = json.dumps(prefs).encode("utf-8")  # Serialize first so the file gets one write, not one per token
+        # Write a temp file and swap it in, so a crash mid-write never leaves a truncated prefs.json
+        path = get_prefs_path()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _cached_mtime = _file_mtime()
+        log_utils.log(app, "✅ Preferences saved to %s", get_prefs_path(), level='INFO', module=LOG_MODULE)
     except Exception as e:
         log_utils.log(app, f"❌ Failed to save prefs: {str(e)}", level='ERROR', module=LOG_MODULE)
 
-# Load preferences from a JSON file
+# Worker loop: wait for a wake-up, let the burst settle, then write the latest prefs
+def _writer_loop(q):
+    while True:
+        item = q.get()
+        if item is _WRITER_STOP:
+            return
+        time.sleep(SAVE_DEBOUNCE)
+        _write_prefs()
+
+def _ensure_writer():
+    global _writer_queue, _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        _writer_queue = queue.Queue()
+        _writer_thread = threading.Thread(target=_writer_loop, args=(_writer_queue,), daemon=True)
+        _writer_thread.start()
+    return _writer_queue
+
+# Save preferences: update the cache now, hand the disk write to the worker thread
+def save_prefs(prefs):
+    global _cached_prefs, _write_pending
+    with _save_lock:
+        _cached_prefs = dict(prefs)
+        if _write_pending:
+            return  # A write is already queued and will pick up these prefs
+        _write_pending = True
+        q = _ensure_writer()
+    q.put(True)
+
+# Merge a dict of changed keys into the preferences and schedule one debounced write
+def update_prefs(changes):
+    preferences = load_prefs()
+    preferences.update(changes)
+    save_prefs(preferences)
+
+# Write any pending preferences immediately and stop the worker (e.g. on add-in stop)
+def flush_prefs():
+    global _writer_queue, _writer_thread
+    _write_prefs()
+    with _save_lock:
+        q = _writer_queue
+        _writer_queue = None
+        _writer_thread = None
+    if q is not None:
+        q.put(_WRITER_STOP)
+
+# Load preferences from the cache, re-reading the JSON file only when it changed on disk
 def load_prefs():
+    global _cached_prefs, _cached_mtime
     try:
-        if os.path.exists(PREFS_PATH):
-            with open(PREFS_PATH, "r") as f:
-                log_utils.log(app,f"✅ Preferences loaded from {PREFS_PATH}", level='INFO', module=LOG_MODULE)
-                return json.load(f)
+        with _save_lock:
+            mtime = None if _write_pending else _file_mtime()
+            if _cached_prefs is not None and (_write_pending or mtime == _cached_mtime):
+                return dict(_cached_prefs)
+        # Open directly instead of exists() first: one syscall fewer, and no window for the file to vanish
+        try:
+            with open(get_prefs_path(), "rb") as f:
+                data = f.read()  # One read into memory, then parse the whole buffer
+        except FileNotFoundError:
+            return DEFAULT_PREFS.copy()
+        log_utils.log(app, "✅ Preferences loaded from %s", get_prefs_path(), level='INFO', module=LOG_MODULE)
+        prefs = json.loads(data)
+        with _save_lock:
+            _cached_prefs = prefs
+            _cached_mtime = mtime
+        return dict(prefs)
     except Exception as e:
         log_utils.log(app,f"❌ Failed to load prefs: {str(e)}", level='ERROR', module=LOG_MODULE)
         return DEFAULT_PREFS.copy()
 
 def send_prefs(palette=None):
     prefs = load_prefs()
-    if prefs is None:
-        prefs = DEFAULT_PREFS.copy()
-    from ..controllers.ui_controller import get_ui_controller
+    from ..controllers.ui_controller import get_ui_controller  # ui_controller imports this module
     ui_controller = get_ui_controller()
     success = ui_controller.send_data_to_palette('loadPrefs', {"prefs": prefs})
     if success:
-        log_utils.log(app, f"✅ Preferences sent to palette: {prefs}", level='INFO', module=LOG_MODULE)
+        log_utils.log(app, "✅ Preferences sent to palette: %s", prefs, level='INFO', module=LOG_MODULE)
         # --- Add this block to sync overlays with prefs ---
         from ..utilities import overlay_utils
         overlay_utils.current_aspect_ratio = prefs.get("aspectRatio", "default")
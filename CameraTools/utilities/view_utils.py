@@ -13,13 +13,27 @@ LOG_MODULE = 'view_utils'
 from ..utilities import log_utils
 log_utils.set_module_logging(LOG_MODULE, False)
 from ..utilities import camera_transforms
-from ..utilities.camera_transforms import derive_document_up
+from ..utilities.camera_commands import apply_named_view_camera
+from ..utilities.camera_transforms import get_document_up
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
 copied_camera_data = None
 
+# Pre-encoded camera mode payloads; every non-orthographic camera type reports as Perspective
+_PERSPECTIVE_MODE_PAYLOAD = '{"cameraMode":"Perspective"}'
+_CAMERA_MODE_PAYLOADS = {adsk.core.CameraTypes.OrthographicCameraType: '{"cameraMode":"Orthographic"}'}
+
+# Named view dropdown throttle: sends within the interval are coalesced into one trailing send
+POPULATE_MIN_INTERVAL = 0.25  # Seconds
+_last_populate_time = 0.0
+_populate_pending = False
+
+# (root component id, named view count) -> dropdown payload; renames keep the count, so
+# anything that can rename or replace views calls invalidate_named_views_cache
+_named_views_cache = (None, None)
+
 def _get_camera_controller():
     """
     Returns the singleton camera controller instance.
@@ -27,6 +41,19 @@ def _get_camera_controller():
     from ..controllers.camera_controller import get_camera_controller
     return get_camera_controller()
 
+def _get_ui_controller():
+    """
+    Returns the singleton UI controller instance.
+    """
+    from ..controllers.ui_controller import get_ui_controller
+    return get_ui_controller()
+
+def _named_view_names(design):
+    """
+    Names of the design's named views in collection order, read in one pass over the collection iterator.
+    """
+    return [view.name for view in design.namedViews]
+
 def get_named_views_list():
     """
     Returns a list of all named views in the current design.
@@ -36,19 +63,33 @@ def get_named_views_list():
         design = app.activeProduct
         if not isinstance(design, adsk.fusion.Design):
             return []
-        named_views = design.namedViews
-        return [{'index': idx, 'name': view.name} for idx, view in enumerate(named_views)]
+        return [{'index': idx, 'name': name} for idx, name in enumerate(_named_view_names(design))]
     except Exception as e:
         log_utils.log(app, f'❌ Failed to get named views: {str(e)}', level='ERROR', module=LOG_MODULE)
         return []
 
+def get_named_views_digest():
+    """
+    Returns a cheap (count, hash of names) digest of the current design's named views.
+    Used to detect changes without building the full list of view dicts.
+    """
+    try:
+        design = app.activeProduct
+        if not isinstance(design, adsk.fusion.Design):
+            return (0, 0)
+        names = tuple(_named_view_names(design))
+        return (len(names), hash(names))
+    except Exception as e:
+        log_utils.log(app, f'❌ Failed to get named views digest: {str(e)}', level='ERROR', module=LOG_MODULE)
+        return None
+
 def apply_named_view_by_index(view_index, palette=None):
     """
     Applies the named view at the given index to the viewport.
     Optionally updates the UI palette after the change.
     """
     try:
-        log_utils.log(app, f'apply_named_view_by_index called with index: {view_index}', level='DEBUG', module=LOG_MODULE)
+        log_utils.log(app, 'apply_named_view_by_index called with index: %s', view_index, level='DEBUG', module=LOG_MODULE)
         design = app.activeProduct
         if not isinstance(design, adsk.fusion.Design):
             log_utils.log(app, 'No active design found', level='ERROR', module=LOG_MODULE)
@@ -58,12 +99,12 @@ def apply_named_view_by_index(view_index, palette=None):
             log_utils.log(app, f'Named view index out of range: {view_index}', level='ERROR', module=LOG_MODULE)
             return False
         named_view = named_views.item(view_index)
-        log_utils.log(app, f'Applying named view: {named_view.name}', level='DEBUG', module=LOG_MODULE)
-        from ..utilities.camera_commands import apply_named_view_camera
+        if log_utils.enabled(LOG_MODULE, 'DEBUG'):
+            log_utils.log(app, 'Applying named view: %s', named_view.name, level='DEBUG', module=LOG_MODULE)
         apply_named_view_camera(named_view, app)
         if palette:
             _update_ui_after_view_change(named_view, palette)
-        log_utils.log(app, f'Applied named view index: {view_index}', level='INFO', module=LOG_MODULE)
+        log_utils.log(app, 'Applied named view index: %s', view_index, level='INFO', module=LOG_MODULE)
         return True
     except Exception as e:
         log_utils.log(app, f'❌ Exception in apply_named_view_by_index: {str(e)}', level='ERROR', module=LOG_MODULE)
@@ -74,14 +115,19 @@ def apply_named_view_by_index(view_index, palette=None):
 def populate_named_views_dropdown(palette=None):
     """
     Sends the list of named views to the UI palette for dropdown population.
-    Throttles updates to avoid excessive UI refreshes.
+    Throttles updates to avoid excessive UI refreshes: a call within POPULATE_MIN_INTERVAL of the
+    last send is deferred to flush_pending_named_views_populate.
     """
-    global _last_populate_time
+    global _last_populate_time, _populate_pending
+    now = time.monotonic()
+    if now - _last_populate_time < POPULATE_MIN_INTERVAL:
+        _populate_pending = True
+        return
+    _last_populate_time = now
+    _populate_pending = False
     try:
-        view_items = get_named_views_list()
-        payload = {'namedViews': view_items}
-        from ..controllers.ui_controller import get_ui_controller
-        ui_controller = get_ui_controller()
+        payload = _named_views_payload()
+        ui_controller = _get_ui_controller()
         success = ui_controller.send_data_to_palette('populateNamedViews', payload)
         if success:
             log_utils.log(app, 'Named views sent successfully', level='INFO', module=LOG_MODULE)
@@ -91,6 +137,37 @@ def populate_named_views_dropdown(palette=None):
         log_utils.log(app, f'❌ Failed to populate named views dropdown: {str(e)}', level='ERROR', module=LOG_MODULE)
         ui.messageBox(f'❌ Failed to populate named views dropdown:\n.   Traceback: {traceback.format_exc()}')
 
+def _named_views_payload():
+    """
+    Returns the dropdown payload, rebuilding the named views list only when the design or view count changed.
+    """
+    global _named_views_cache
+    design = app.activeProduct
+    key = None
+    if isinstance(design, adsk.fusion.Design):
+        key = (design.rootComponent.id, design.namedViews.count)
+        cached_key, payload = _named_views_cache
+        if key == cached_key:
+            return payload
+    payload = {'namedViews': get_named_views_list()}
+    _named_views_cache = (key, payload) if key is not None else (None, None)
+    return payload
+
+def invalidate_named_views_cache(args=None):
+    """
+    Forces the next dropdown population to re-read the named views.
+    """
+    global _named_views_cache
+    _named_views_cache = (None, None)
+
+def flush_pending_named_views_populate(palette=None):
+    """
+    Sends a throttled dropdown population once its interval has passed (trailing edge).
+    Called from the low frequency UI tick.
+    """
+    if _populate_pending and time.monotonic() - _last_populate_time >= POPULATE_MIN_INTERVAL:
+        populate_named_views_dropdown(palette)
+
 def reset_named_view_dropdown(self):
     """
     Tells the JS UI to reset the named view dropdown.
@@ -113,42 +190,46 @@ def save_named_view_interactive():
         cam = app.activeViewport.camera
         # Determine base name based on camera type
         base_name = "Camera Tools Persp View" if cam.cameraType == adsk.core.CameraTypes.PerspectiveCameraType else "Camera Tools Ortho View"
-        # Collect existing names and generate a unique candidate
-        existing_names = set(view.name for view in named_views)
+        # Generate a unique candidate; the full name scan is only needed when the base name is taken
         candidate_name = base_name
-        suffix = 1
-        while candidate_name in existing_names:
-            candidate_name = f"{base_name} {suffix}"
-            suffix += 1
+        if named_views.itemByName(base_name):
+            existing_names = set(view.name for view in named_views)
+            suffix = 1
+            while candidate_name in existing_names:
+                candidate_name = f"{base_name} {suffix}"
+                suffix += 1
         # Prompt user with the unique default name
         result, cancelled = ui.inputBox('Name: ', 'Save Named View', candidate_name)
         if cancelled or not result:
             return None
-        view_name = result[0] if isinstance(result, list) else result
+        view_name = str(result[0] if isinstance(result, list) else result)
         log_camera_properties(cam)
-        # Save the initial named view
-        named_views.add(cam, str(view_name))
-        # Find the saved view and log its camera
-        saved_cam = None
-        for view in named_views:
-            if view.name == view_name:
-                log_camera_properties(view.camera)
-                saved_cam = view.camera
-                break
+        # Save the initial named view, then look it up by name and log its camera
+        named_views.add(cam, view_name)
+        invalidate_named_views_cache()
+        saved_view = named_views.itemByName(view_name)
+        saved_cam = saved_view.camera if saved_view else None
         if saved_cam:
+            log_camera_properties(saved_cam)
             # Compensate for Fusion's view extents quirk
             fresh_view_extents = saved_cam.viewExtents / 10
-            compensated_eye_x = cam.target.x + (cam.eye.x - cam.target.x) * fresh_view_extents
-            compensated_eye_y = cam.target.y + (cam.eye.y - cam.target.y) * fresh_view_extents
-            compensated_eye_z = cam.target.z + (cam.eye.z - cam.target.z) * fresh_view_extents
-            cam.eye = adsk.core.Point3D.create(compensated_eye_x, compensated_eye_y, compensated_eye_z)
-            # Remove and re-add the named view with compensated eye
-            named_views.itemByName(view_name).deleteMe()
-            named_views.add(cam, str(view_name))
+            # Read eye and target once each; every .x/.y/.z on the camera would be another API call
+            tx, ty, tz = cam.target.asArray()
+            ex, ey, ez = cam.eye.asArray()
+            cam.eye = adsk.core.Point3D.create(
+                tx + (ex - tx) * fresh_view_extents,
+                ty + (ey - ty) * fresh_view_extents,
+                tz + (ez - tz) * fresh_view_extents
+            )
+            # Update the saved view in place; fall back to remove and re-add where the camera is read-only
+            try:
+                saved_view.camera = cam
+            except Exception:
+                saved_view.deleteMe()
+                saved_view = named_views.add(cam, view_name)
             # Log the updated saved view camera properties
-            for view in named_views:
-                if view.name == view_name:
-                    log_camera_properties(view.camera)
+            if saved_view:
+                log_camera_properties(saved_view.camera)
         ui.messageBox(f'Saved named view: {view_name}')
         return view_name
     except Exception as e:
@@ -169,11 +250,15 @@ def copy_view():
         if design is None:
             log_utils.log(app, "❌ No active design/product. Copy aborted.", level='ERROR', module=LOG_MODULE)
             return False
-        up_vector = derive_document_up(design)
+        up_vector = get_document_up(design)
+        to_canonical = camera_transforms.get_canonical_matrices(up_vector, adsk)[0]
+        # Eye and target in one pass over the matrix; the up vector only takes the rotation
+        (ex, ey, ez), (tx, ty, tz) = camera_transforms.transform_points_batch((camera.eye.asArray(), camera.target.asArray()), to_canonical)
+        ux, uy, uz = camera_transforms.rotate_xyz(camera_transforms.get_matrix_array(to_canonical), *camera.upVector.asArray())
         copied_camera_data = {
-            'eye': {k: getattr(camera_transforms.to_canon_point(camera.eye, up_vector, adsk), k) for k in ('x', 'y', 'z')},
-            'target': {k: getattr(camera_transforms.to_canon_point(camera.target, up_vector, adsk), k) for k in ('x', 'y', 'z')},
-            'upVector': {k: getattr(camera_transforms.to_canon_vector(camera.upVector, up_vector, adsk), k) for k in ('x', 'y', 'z')},
+            'eye': {'x': ex, 'y': ey, 'z': ez},
+            'target': {'x': tx, 'y': ty, 'z': tz},
+            'upVector': {'x': ux, 'y': uy, 'z': uz},
             'perspectiveAngle': camera.perspectiveAngle,
             'cameraType': camera.cameraType
         }
@@ -199,7 +284,6 @@ def paste_view(palette=None):
             log_utils.log(app, '🔽 Camera view pasted successfully', level='INFO', module=LOG_MODULE)
             log_camera_properties(app.activeViewport.camera)
             if palette:
-                camera_mode = 'Orthographic' if copied_camera_data['cameraType'] == adsk.core.CameraTypes.OrthographicCameraType else 'Perspective'
                 _send_camera_mode_update(palette, copied_camera_data['cameraType'])
                 log_copied_camera_data(copied_camera_data)
         else:
@@ -214,10 +298,7 @@ def _update_ui_after_view_change(named_view, palette):
     Sends the new camera mode to the palette.
     """
     try:
-        viewport = app.activeViewport
-        applied_camera = viewport.camera
-        camera_mode = 'Orthographic' if applied_camera.cameraType == adsk.core.CameraTypes.OrthographicCameraType else 'Perspective'
-        _send_camera_mode_update(palette, applied_camera.cameraType)
+        _send_camera_mode_update(palette, app.activeViewport.camera.cameraType)
     except Exception as e:
         log_utils.log(app, f'❌ Failed to update UI after view change: {str(e)}', level='ERROR', module=LOG_MODULE)
 
@@ -226,11 +307,9 @@ def _send_camera_mode_update(palette, camera_type):
     Sends the camera mode (Perspective/Orthographic) to the UI palette.
     """
     try:
-        camera_mode = 'Orthographic' if camera_type == adsk.core.CameraTypes.OrthographicCameraType else 'Perspective'
-        payload = {'cameraMode': camera_mode}
-        from ..controllers.ui_controller import get_ui_controller
-        ui_controller = get_ui_controller()
-        success = ui_controller.send_data_to_palette('updateCameraMode', payload)
+        payload_json = _CAMERA_MODE_PAYLOADS.get(camera_type, _PERSPECTIVE_MODE_PAYLOAD)
+        ui_controller = _get_ui_controller()
+        success = ui_controller.send_serialized_to_palette('updateCameraMode', payload_json)
         if not success:
             log_utils.log(app, '❌ Failed to send camera mode update: palette not visible or not available', level='ERROR', module=LOG_MODULE)
     except Exception as e:
@@ -240,21 +319,23 @@ def log_camera_properties(camera):
     """
     Logs all camera properties for debugging.
     """
+    if not log_utils.enabled(LOG_MODULE, 'INFO'):
+        return  # Skip the float formatting entirely when the message would be dropped
     try:
-        properties = [
-            f"---",
-            f"🎥 🎥 🎥 Camera Properties: 🎥 🎥 🎥 ",
-            f"Camera Type: {camera.cameraType}",
-            f"Eye: ({camera.eye.x:.3f}, {camera.eye.y:.3f}, {camera.eye.z:.3f})",
-            f"Target: ({camera.target.x:.3f}, {camera.target.y:.3f}, {camera.target.z:.3f})",
-            f"Up Vector: ({camera.upVector.x:.3f}, {camera.upVector.y:.3f}, {camera.upVector.z:.3f})",
-            f"Perspective Angle: {math.degrees(camera.perspectiveAngle):.2f}°",
-            f"Is Fit View: {getattr(camera, 'isFitView', 'N/A')}",
-            f"Is Smooth Transition: {getattr(camera, 'isSmoothTransition', 'N/A')}",
-            f"---",
-        ]
-        for prop in properties:
-            log_utils.log(app, prop, level='INFO', module=LOG_MODULE)
+        # One multi-line message, one log call
+        eye, target, up = camera.eye, camera.target, camera.upVector
+        log_utils.log(app, (
+            f"---\n"
+            f"🎥 🎥 🎥 Camera Properties: 🎥 🎥 🎥 \n"
+            f"Camera Type: {camera.cameraType}\n"
+            f"Eye: ({eye.x:.3f}, {eye.y:.3f}, {eye.z:.3f})\n"
+            f"Target: ({target.x:.3f}, {target.y:.3f}, {target.z:.3f})\n"
+            f"Up Vector: ({up.x:.3f}, {up.y:.3f}, {up.z:.3f})\n"
+            f"Perspective Angle: {math.degrees(camera.perspectiveAngle):.2f}°\n"
+            f"Is Fit View: {getattr(camera, 'isFitView', 'N/A')}\n"
+            f"Is Smooth Transition: {getattr(camera, 'isSmoothTransition', 'N/A')}\n"
+            f"---"
+        ), level='INFO', module=LOG_MODULE)
     except Exception as e:
         log_utils.log(app, f'❌ Failed to log camera properties: {str(e)}', level='ERROR', module=LOG_MODULE)
 
@@ -262,20 +343,22 @@ def log_copied_camera_data(data):
     """
     Logs all copied camera data for debugging.
     """
+    if not log_utils.enabled(LOG_MODULE, 'INFO'):
+        return  # Skip the float formatting entirely when the message would be dropped
     try:
-        properties = [
-            f"---",
-            f"🎥 🎥 🎥 Camera Data: 🎥 🎥 🎥 ",
-            f"Camera Type: {data.get('cameraType', 'N/A')}",
-            f"Eye: ({data['eye']['x']:.3f}, {data['eye']['y']:.3f}, {data['eye']['z']:.3f})",
-            f"Target: ({data['target']['x']:.3f}, {data['target']['y']:.3f}, {data['target']['z']:.3f})",
-            f"Up Vector: ({data['upVector']['x']:.3f}, {data['upVector']['y']:.3f}, {data['upVector']['z']:.3f})",
-            f"Perspective Angle: {math.degrees(data['perspectiveAngle']):.2f}°",
-            f"Is Fit View: {data.get('isFitView', 'N/A')}",
-            f"Is Smooth Transition: {data.get('isSmoothTransition', 'N/A')}",
-            f"---",
-        ]
-        for prop in properties:
-            log_utils.log(app, prop, level='INFO', module=LOG_MODULE)
+        # One multi-line message, one log call
+        eye, target, up = data['eye'], data['target'], data['upVector']
+        log_utils.log(app, (
+            f"---\n"
+            f"🎥 🎥 🎥 Camera Data: 🎥 🎥 🎥 \n"
+            f"Camera Type: {data.get('cameraType', 'N/A')}\n"
+            f"Eye: ({eye['x']:.3f}, {eye['y']:.3f}, {eye['z']:.3f})\n"
+            f"Target: ({target['x']:.3f}, {target['y']:.3f}, {target['z']:.3f})\n"
+            f"Up Vector: ({up['x']:.3f}, {up['y']:.3f}, {up['z']:.3f})\n"
+            f"Perspective Angle: {math.degrees(data['perspectiveAngle']):.2f}°\n"
+            f"Is Fit View: {data.get('isFitView', 'N/A')}\n"
+            f"Is Smooth Transition: {data.get('isSmoothTransition', 'N/A')}\n"
+            f"---"
+        ), level='INFO', module=LOG_MODULE)
     except Exception as e:
         log_utils.log(app, f'❌ Failed to log copied camera data: {str(e)}', level='ERROR', module=LOG_MODULE)
\ No newline at end of file